@@ -43,6 +43,7 @@ and the three clutch openings) and three outputs (the computed torque on each cl
 # input files.
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from pytwin import TwinModel, download_file, load_data
 
@@ -116,16 +117,23 @@ twin_model_input_df = load_data(csv_input)
 data_dimensions = twin_model_input_df.shape
 number_of_datapoints = data_dimensions[0] - 1
 
+# Extract the time instants and input values once as NumPy arrays so that the
+# simulation loop does not index the dataframe at each step
+input_names = list(twin_model_input_df.columns[1::])
+input_times = twin_model_input_df.iloc[:, 0].to_numpy(dtype=float)
+input_values = twin_model_input_df.iloc[:, 1:].to_numpy(dtype=float)
+
 ###############################################################################
 # Define the initial inputs of the twin model and initialize it
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Define the inputs of the twin model, initialize it, and collect
-# the output values.
+# the output values. Results are stored in a preallocated array with one row
+# per time instant (time followed by the output values).
 
 twin_model.initialize_evaluation(json_config_filepath=twin_config)
-outputs = [twin_model.evaluation_time]
-for item in twin_model.outputs:
-    outputs.append(twin_model.outputs[item])
+results_step = np.empty((number_of_datapoints + 1, len(twin_model.outputs) + 1))
+results_step[0, 0] = twin_model.evaluation_time
+results_step[0, 1:] = list(twin_model.outputs.values())
 
 ###############################################################################
 # Simulate the twin in step by step mode
@@ -133,22 +141,17 @@ for item in twin_model.outputs:
 # Loop over all inputs, simulating the twin at each time step
 # and collecting the corresponding output values.
 
-sim_output_list_step = [outputs]
 data_index = 0
 while data_index < number_of_datapoints:
     # Gets the stop time of the current simulation step
-    time_end = twin_model_input_df.iloc[data_index + 1][0]
+    time_end = input_times[data_index + 1]
     step = time_end - twin_model.evaluation_time
-    inputs = dict()
-    for column in twin_model_input_df.columns[1::]:
-        inputs[column] = twin_model_input_df[column][data_index]
+    inputs = dict(zip(input_names, input_values[data_index]))
     twin_model.evaluate_step_by_step(step_size=step, inputs=inputs)
-    outputs = [twin_model.evaluation_time]
-    for item in twin_model.outputs:
-        outputs.append(twin_model.outputs[item])
-    sim_output_list_step.append(outputs)
+    results_step[data_index + 1, 0] = twin_model.evaluation_time
+    results_step[data_index + 1, 1:] = list(twin_model.outputs.values())
     data_index += 1
-results_step_pd = pd.DataFrame(sim_output_list_step, columns=["Time"] + list(twin_model.outputs), dtype=float)
+results_step_pd = pd.DataFrame(results_step, columns=["Time"] + list(twin_model.outputs), copy=False)
 
 ###############################################################################
 # Simulate the twin in batch mode
@@ -158,13 +161,8 @@ results_step_pd = pd.DataFrame(sim_output_list_step, columns=["Time"] + list(twi
 # the outputs at once.
 
 data_index = 0
-inputs = dict()
-for column in twin_model_input_df.columns[1::]:
-    inputs[column] = twin_model_input_df[column][data_index]
+inputs = dict(zip(input_names, input_values[data_index]))
 twin_model.initialize_evaluation(inputs=inputs, json_config_filepath=twin_config)
-outputs = [twin_model.evaluation_time]
-for item in twin_model.outputs:
-    outputs.append(twin_model.outputs[item])
 results_batch_pd = twin_model.evaluate_batch(twin_model_input_df)
 
 ###############################################################################
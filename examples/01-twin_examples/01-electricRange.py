@@ -47,7 +47,10 @@ effects on the overall electric range can be seen.
 # Perform required imports, which include downloading and importing the input
 # files.
 
+import math
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from pytwin import TwinModel, download_file
 
@@ -125,6 +128,7 @@ twin_model = TwinModel(twin_file)
 
 time_step = 1.0
 time_end = 24000.0  # Simulate the model for 400 minutes
+number_of_steps = int(math.ceil(time_end / time_step))
 print("Twin parameters : {}".format(twin_model.parameters))
 dp1 = {"ElectricRange_powerLoad": 2000.0, "ElectricRange_vehicleMass": 2000.0}
 dp2 = {"ElectricRange_powerLoad": 3000.0, "ElectricRange_vehicleMass": 2000.0}
@@ -134,31 +138,18 @@ sweep = [dp1, dp2, dp3]
 ###############################################################################
 # Simulate the twin for each set of parameter values
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-# Simulate the twin for each set of parameters values for each time step
-# and collect corresponding output values.
+# Simulate the twin for each set of parameters values in batch mode. The
+# twin inputs are kept constant, so the input dataframe only holds the time
+# instants at which the output values are collected.
 
+input_df = pd.DataFrame({"Time": np.linspace(0.0, time_end, number_of_steps + 1)})
 results = []
 for dp in sweep:
-    # Initialize twin model with the correct parameters values and collect
-    # initial output values
-
+    # Initialize twin model with the correct parameters values and evaluate
+    # all the time instants at once
+    print("Simulating the model with parameters {}".format(dp))
     twin_model.initialize_evaluation(parameters=dp)
-    outputs = [twin_model.evaluation_time]
-    for item in twin_model.outputs:
-        outputs.append(twin_model.outputs[item])
-    sim_output = [outputs]
-    while twin_model.evaluation_time < time_end:
-        step = time_step
-        twin_model.evaluate_step_by_step(step_size=step)
-        outputs = [twin_model.evaluation_time]
-        for item in twin_model.outputs:
-            outputs.append(twin_model.outputs[item])
-        sim_output.append(outputs)
-        if twin_model.evaluation_time % 1000 == 0.0:
-            print(
-                "Simulating the model with parameters {}, evaluation time = {}".format(dp, twin_model.evaluation_time)
-            )
-    sim_results = pd.DataFrame(sim_output, columns=["Time"] + list(twin_model.outputs), dtype=float)
+    sim_results = twin_model.evaluate_batch(input_df)
     results.append(sim_results)
 
 ###############################################################################
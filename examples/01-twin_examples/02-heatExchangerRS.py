@@ -121,25 +121,24 @@ twin_model = TwinModel(twin_file)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Because the twin is based on a static model, two options can be considered:
 #
-# - Set the initial input value to evaluate and run the initialization function (current approach).
+# - Set the initial input value to evaluate and run the initialization function for each value.
 # - Create an input dataframe considering all input values to evaluate and run the batch function
-#   to evaluate. In this case, to execute the transient simulation, a time dimension must be
-#   arbitrarily defined.
+#   to evaluate (current approach). In this case, to execute the transient simulation, a time
+#   dimension must be arbitrarily defined.
 
-results = []
 input_name = list(twin_model.inputs.keys())[0]
-for dp in numpy.linspace(start=heat_flow_min, stop=heat_flow_max, num=int((heat_flow_max - heat_flow_min) / step + 1)):
-    # Initialize twin with input values and collect output value
-
-    dp_input = {input_name: dp}
-    twin_model.initialize_evaluation(inputs=dp_input)
-    outputs = [dp]
-    for item in twin_model.outputs:
-        outputs.append(twin_model.outputs[item])
-    results.append(outputs)
-    if dp % 1000 == 0.0:
-        print("Simulating the model with input {}".format(dp))
-sim_results = pd.DataFrame(results, columns=[input_name] + list(twin_model.outputs), dtype=float)
+input_values = numpy.linspace(
+    start=heat_flow_min, stop=heat_flow_max, num=int((heat_flow_max - heat_flow_min) / step + 1)
+)
+# One arbitrary second per input value
+input_df = pd.DataFrame({"Time": numpy.arange(len(input_values), dtype=float), input_name: input_values})
+
+print("Simulating the model with {} input values".format(len(input_values)))
+twin_model.initialize_evaluation(inputs={input_name: input_values[0]})
+sim_results = twin_model.evaluate_batch(input_df)
+# Replace the arbitrary time dimension with the evaluated input values
+sim_results["Time"] = input_values
+sim_results = sim_results.rename(columns={"Time": input_name})
 
 
 ###############################################################################
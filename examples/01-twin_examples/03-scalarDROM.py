@@ -51,6 +51,7 @@ to a specified location, where logging files are available.
 import os
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from pytwin import TwinModel, download_file, load_data, modify_pytwin_working_dir
 
@@ -117,6 +118,12 @@ twin_model_input_df = load_data(csv_input)
 data_dimensions = twin_model_input_df.shape
 number_of_datapoints = data_dimensions[0] - 1
 
+# Extract the time instants and input values once as NumPy arrays so that the
+# simulation loop does not index the dataframe at each step
+input_names = list(twin_model_input_df.columns[1::])
+input_times = twin_model_input_df.iloc[:, 0].to_numpy(dtype=float)
+input_values = twin_model_input_df.iloc[:, 1:].to_numpy(dtype=float)
+
 ###############################################################################
 # Load the twin runtime and instantiate it
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -130,12 +137,14 @@ twin_model_what_if = None  # the second twin used for what-if analysis
 # Define the inputs of the twin model and initialize it
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Define the inputs of the twin model, initialize it, and collect
-# the output values.
+# the output values. Results are stored in preallocated arrays with one row
+# per time instant (time followed by the output values).
 
 twin_model.initialize_evaluation()
-outputs = [twin_model.evaluation_time]
-for item in twin_model.outputs:
-    outputs.append(twin_model.outputs[item])
+results_step = np.empty((number_of_datapoints + 1, len(twin_model.outputs) + 1))
+results_what_if_step = np.empty_like(results_step)
+results_step[0, 0] = twin_model.evaluation_time
+results_step[0, 1:] = list(twin_model.outputs.values())
 
 ###############################################################################
 # Simulate the twin for each time step
@@ -143,8 +152,7 @@ for item in twin_model.outputs:
 # Loop over all inputs, simulating the twin one time step at a
 # time and collecting the corresponding output values.
 
-sim_output_list_step = [outputs]
-sim_what_if_output_list_step = []
+what_if_start_index = 0
 data_index = 0
 while data_index < number_of_datapoints:
     if data_index == int(number_of_datapoints / 4) and twin_model_what_if is None:
@@ -153,39 +161,31 @@ while data_index < number_of_datapoints:
         # Instantiate a new twin model with same TWIN file and load the saved state
         twin_model_what_if = TwinModel(twin_file)
         twin_model_what_if.load_state(model_id=twin_model.id, evaluation_time=twin_model.evaluation_time)
-        sim_what_if_output_list_step.append(outputs)
+        what_if_start_index = data_index
+        results_what_if_step[data_index] = results_step[data_index]
 
     # Get the stop time of the current simulation step
-    time_end = twin_model_input_df.iloc[data_index + 1][0]
+    time_end = input_times[data_index + 1]
     step = time_end - twin_model.evaluation_time
-    inputs = dict()
-    for column in twin_model_input_df.columns[1::]:
-        inputs[column] = twin_model_input_df[column][data_index]
+    inputs = dict(zip(input_names, input_values[data_index]))
     twin_model.evaluate_step_by_step(step_size=step, inputs=inputs)
-    outputs = [twin_model.evaluation_time]
-    for item in twin_model.outputs:
-        outputs.append(twin_model.outputs[item])
-    sim_output_list_step.append(outputs)
+    results_step[data_index + 1, 0] = twin_model.evaluation_time
+    results_step[data_index + 1, 1:] = list(twin_model.outputs.values())
     if twin_model_what_if is not None:
-        inputs = dict()
-        for column in twin_model_input_df.columns[1::]:
-            inputs[column] = (
-                twin_model_input_df[column][data_index] * 0.9
-            )  # Evaluate the second twin using the same inputs reduced by 10%
+        # Evaluate the second twin using the same inputs reduced by 10%
+        inputs = dict(zip(input_names, input_values[data_index] * 0.9))
         twin_model_what_if.evaluate_step_by_step(step_size=step, inputs=inputs)
-        outputs = [twin_model_what_if.evaluation_time]
-        for item in twin_model_what_if.outputs:
-            outputs.append(twin_model_what_if.outputs[item])
-        sim_what_if_output_list_step.append(outputs)
+        results_what_if_step[data_index + 1, 0] = twin_model_what_if.evaluation_time
+        results_what_if_step[data_index + 1, 1:] = list(twin_model_what_if.outputs.values())
     data_index += 1
-results_step_pd = pd.DataFrame(sim_output_list_step, columns=["Time"] + list(twin_model.outputs), dtype=float)
+results_step_pd = pd.DataFrame(results_step, columns=["Time"] + list(twin_model.outputs), copy=False)
 
 outputs_names = list(twin_model.outputs)
 output_names_parallel = []
 for i in range(0, len(outputs_names)):
     output_names_parallel.append(outputs_names[i] + " - what-if : load reduced by 10%")
 results_what_if_step_pd = pd.DataFrame(
-    sim_what_if_output_list_step, columns=["Time"] + output_names_parallel, dtype=float
+    results_what_if_step[what_if_start_index:], columns=["Time"] + output_names_parallel, copy=False
 )
 
 ###############################################################################
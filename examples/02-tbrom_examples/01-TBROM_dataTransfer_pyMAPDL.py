@@ -112,8 +112,7 @@ geometry = twin_model.get_geometry_filepath(rom_name=rom_name)
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Map the temperature data to the FEA mesh.
 
-temperature_data = snapshot_to_array(snapshot, geometry)  # Save data to a NumPy array
-nd_temp_data = temperature_data[:, :].astype(float)  # Change data type to float
+nd_temp_data = snapshot_to_array(snapshot, geometry)  # Save data to a NumPy array of floats
 
 # Map temperature data to the FE mesh
 # Convert imported data into PolyData format
@@ -125,8 +124,8 @@ inter_grid = grid.interpolate(
     wrapped, sharpness=5, radius=0.0001, strategy="closest_point", progress_bar=True
 )  # Map the imported data to MAPDL grid
 inter_grid.plot(show_edges=False)  # Plot the interpolated data on MAPDL grid
-temperature_load_val = pv.convert_array(
-    pv.convert_array(inter_grid.active_scalars)
+temperature_load_val = np.asarray(
+    inter_grid.active_scalars
 )  # Save temperatures interpolated to each node as a NumPy array
 node_num = inter_grid.point_data["ansys_node_num"]  # Save node numbers as a NumPy array
 
@@ -232,9 +232,8 @@ for i in range(0, len(rom_inputs)):
     dp_input = {input_name: dp}
     dp_field_input = {romname: {fieldname: inputfieldsnapshots[i]}}
     twin_model.initialize_evaluation(inputs=dp_input, field_inputs=dp_field_input)
-    outputs = [dp]
-    for item in output_name_without_mcs:
-        outputs.append(twin_model.outputs[item])
+    twin_outputs = twin_model.outputs
+    outputs = [dp] + [twin_outputs[item] for item in output_name_without_mcs]
     outfield = twin_model.generate_snapshot(romname, False)  # generating the field output on the entire domain
     outputs.append(max(norm_vector_field(outfield)))
     outfieldns = twin_model.generate_snapshot(romname, False, ns)  # generating the field output on "Group_2"
@@ -245,7 +244,9 @@ pointsns_path = twin_model.generate_points(romname, True, ns)  # generating the
 
 
 sim_results = pd.DataFrame(
-    results, columns=[input_name] + output_name_without_mcs + ["MaxDefSnapshot", "MaxDefSnapshotNs"], dtype=float
+    np.array(results, dtype=float),
+    columns=[input_name] + output_name_without_mcs + ["MaxDefSnapshot", "MaxDefSnapshotNs"],
+    copy=False,
 )
 
 ###############################################################################
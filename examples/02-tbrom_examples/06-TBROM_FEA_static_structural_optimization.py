@@ -84,16 +84,14 @@ print("Initializing the Twin")
 twin_model = TwinModel(twin_file)
 input_name = list(twin_model.inputs.keys())[0]
 results = []
-for dp in design_points:
+for dp_index, dp in enumerate(design_points):
     dp_input = {input_name: dp}
     twin_model.initialize_evaluation(inputs=dp_input)
-    outputs = [dp]
-    for item in twin_model.outputs:
-        outputs.append(twin_model.outputs[item])
+    outputs = [dp] + list(twin_model.outputs.values())
     results.append(outputs)
-    if dp % 10 * step == 0.0:
+    if dp_index % 10 == 0:
         print("Simulating the model with input {}".format(dp))
-sim_results = pd.DataFrame(results, columns=[input_name] + list(twin_model.outputs), dtype=float)
+sim_results = pd.DataFrame(np.array(results, dtype=float), columns=[input_name] + list(twin_model.outputs), copy=False)
 
 ##################################################################################
 # Results analysis (2D curves, as well as 3D visualization of field results)
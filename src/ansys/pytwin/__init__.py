@@ -26,10 +26,7 @@ pytwin.
 library
 """
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:
-    import importlib_metadata
+import importlib
 
 # Checking if tqdm is installed.
 # If it is, the default value for progress_bar is true.
@@ -40,9 +37,6 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     _HAS_TQDM = False
 
-
-__version__ = importlib_metadata.version("pytwin")
-
 """
 PUBLIC API TO PYTWIN SETTINGS
 """
@@ -70,18 +64,50 @@ PYTWIN_LOGGING_OPT_CONSOLE = PyTwinLogOption.PYTWIN_LOGGING_OPT_CONSOLE
 PYTWIN_LOGGING_OPT_NOLOGGING = PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING
 
 """
-PUBLIC API TO PYTWIN EVALUATE
-"""
-from pytwin.evaluate.tbrom import read_binary, read_snapshot_size, snapshot_to_array, write_binary
-from pytwin.evaluate.twin_model import TwinModel, TwinModelError
+PUBLIC API TO PYTWIN EVALUATE, PYTWIN RUNTIME AND EXAMPLES
 
+These symbols are imported on first access (PEP 562) so that importing pytwin, for instance to use
+its settings only, does not load pandas, pyvista and the twin runtime modules.
 """
-PUBLIC API TO PYTWIN RUNTIME
-"""
-from pytwin.twin_runtime.log_level import LogLevel
-from pytwin.twin_runtime.twin_runtime_core import TwinRuntime, TwinRuntimeError
+_LAZY_IMPORTS = {
+    # PYTWIN EVALUATE
+    "read_binary": "pytwin.evaluate.tbrom",
+    "read_snapshot_size": "pytwin.evaluate.tbrom",
+    "snapshot_to_array": "pytwin.evaluate.tbrom",
+    "write_binary": "pytwin.evaluate.tbrom",
+    "TwinModel": "pytwin.evaluate.twin_model",
+    "TwinModelError": "pytwin.evaluate.twin_model",
+    # PYTWIN RUNTIME
+    "LogLevel": "pytwin.twin_runtime.log_level",
+    "TwinRuntime": "pytwin.twin_runtime.twin_runtime_core",
+    "TwinRuntimeError": "pytwin.twin_runtime.twin_runtime_core",
+    # EXAMPLES
+    "download_file": "pytwin.examples.downloads",
+    "load_data": "pytwin.examples.downloads",
+}
 
-"""
-PUBLIC API TO EXAMPLES
-"""
-from pytwin.examples.downloads import download_file, load_data
+
+def _get_version():
+    # The installed distribution metadata is only looked up when __version__ is first accessed
+    try:
+        import importlib.metadata as importlib_metadata
+    except ModuleNotFoundError:
+        import importlib_metadata
+
+    return importlib_metadata.version("pytwin")
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _get_version()
+    elif name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the symbol so that next accesses do not go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {"__version__"})
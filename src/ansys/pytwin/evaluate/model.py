@@ -20,11 +20,26 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from functools import lru_cache
 import os
-import uuid
+import secrets
 
-from pytwin import PyTwinLogLevel, get_pytwin_logger, get_pytwin_working_dir, pytwin_logging_is_enabled
-from pytwin.settings import PYTWIN_SETTINGS
+from pytwin import PyTwinLogLevel, get_pytwin_logger, get_pytwin_working_dir
+from pytwin.settings import PYTWIN_SETTINGS, pytwin_logging_is_enabled_for
+
+# The PyTwin logger is a process-wide singleton that is only configured, never replaced, by the settings
+_LOGGER = get_pytwin_logger()
+
+
+@lru_cache(maxsize=256)
+def _model_paths(working_dir: str, model_name: str, model_id: str):
+    """
+    Return the model directory, model temporary directory, model log file and model log link paths. Paths are
+    cached per working directory, model name and model ID since they are read many times during a model lifetime.
+    """
+    model_dir = os.path.join(working_dir, f"{model_name}.{model_id}")
+    model_temp = os.path.join(working_dir, PYTWIN_SETTINGS.TEMP_WD_NAME)
+    return model_dir, model_temp, os.path.join(model_temp, f"{model_id}.log"), os.path.join(model_dir, "link.log")
 
 
 class Model:
@@ -39,32 +54,33 @@ class Model:
     """
 
     def __init__(self):
-        self._id = f"{uuid.uuid4()}"[0:24].replace("-", "")
+        self._id = secrets.token_hex(10)
         self._model_name = None
         self._log_key = None
+        self._log_prefix = None
+        self._log_prefix_key = None
 
     def _log_message(self, msg: str, level: PyTwinLogLevel = PyTwinLogLevel.PYTWIN_LOG_INFO):
         """
         Provides a base class method for logging messages at key steps in the code logic.
         """
-        msg = f"[{self._model_name}.{self._id}][{self._log_key}] {msg}"
-        logger = get_pytwin_logger()
-        if pytwin_logging_is_enabled():
-            if level == PyTwinLogLevel.PYTWIN_LOG_DEBUG:
-                logger.debug(msg)
-                return
-            if level == PyTwinLogLevel.PYTWIN_LOG_INFO:
-                logger.info(msg)
-                return
-            if level == PyTwinLogLevel.PYTWIN_LOG_WARNING:
-                logger.warning(msg)
-                return
-            if level == PyTwinLogLevel.PYTWIN_LOG_ERROR:
-                logger.error(msg)
-                return
-            if level == PyTwinLogLevel.PYTWIN_LOG_CRITICAL:
-                logger.critical(msg)
-                return
+        # Skip building the prefixed message if it would be discarded by the PyTwin logger
+        if not pytwin_logging_is_enabled_for(level):
+            return
+        # PyTwin log levels follow standard Python logging levels. The message is formatted by the logging module
+        # only when a handler emits the record.
+        _LOGGER.log(level.value, "%s %s", self._get_log_prefix(), msg)
+
+    def _get_log_prefix(self):
+        """
+        Return the ``[<model name>.<model ID>][<log key>]`` prefix of the model log messages. The prefix is only
+        rebuilt when the model name, ID or log key changed since the last logged message.
+        """
+        prefix_key = (self._model_name, self._id, self._log_key)
+        if prefix_key != self._log_prefix_key:
+            self._log_prefix_key = prefix_key
+            self._log_prefix = f"[{self._model_name}.{self._id}][{self._log_key}]"
+        return self._log_prefix
 
     def _raise_model_error(self, msg):
         """
@@ -92,23 +108,23 @@ class Model:
     @property
     def model_dir(self):
         """Model directory (within the global working directory)."""
-        return os.path.join(get_pytwin_working_dir(), f"{self._model_name}.{self._id}")
+        return _model_paths(get_pytwin_working_dir(), self._model_name, self._id)[0]
 
     @property
     def model_temp(self):
         """Model temporary directory (within the global working directory). This temporary directory
         is shared by all models."""
-        return os.path.join(get_pytwin_working_dir(), PYTWIN_SETTINGS.TEMP_WD_NAME)
+        return _model_paths(get_pytwin_working_dir(), self._model_name, self._id)[1]
 
     @property
     def model_log(self):
         """Path to the model log file that is used at twin runtime instantiation."""
-        return os.path.join(self.model_temp, f"{self._id}.log")
+        return _model_paths(get_pytwin_working_dir(), self._model_name, self._id)[2]
 
     @property
     def model_log_link(self):
         """Path to the symbolic link to the model log file."""
-        return os.path.join(self.model_dir, f"link.log")
+        return _model_paths(get_pytwin_working_dir(), self._model_name, self._id)[3]
 
 
 class ModelError(Exception):
@@ -22,11 +22,21 @@
 
 import json
 import os
-import uuid
+import secrets
 
-import numpy as np
-from pytwin import get_pytwin_logger
-from pytwin.evaluate.model import Model
+from pytwin import PyTwinLogLevel, get_pytwin_logger, get_pytwin_working_dir
+from pytwin.evaluate.model import _model_paths
+from pytwin.settings import pytwin_logging_is_enabled_for
+
+# orjson is used to decode the registry file if installed. Both loaders
+# accept bytes directly.
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    _json_loads = json.loads
+
+# Same PyTwin logger instance as the one used by the models
+_LOGGER = get_pytwin_logger()
 
 
 class SavedState:
@@ -40,8 +50,11 @@ class SavedState:
     OUTPUTS_KEY = "outputs"
     PARAMETERS_KEY = "parameters"
 
+    # A saved state is created for each save_state call, avoid a per-instance dictionary
+    __slots__ = ("_id", "time", "inputs", "outputs", "parameters")
+
     def __init__(self):
-        self._id = f"{uuid.uuid4()}"[0:24].replace("-", "")
+        self._id = secrets.token_hex(10)
         self.time = None
         self.inputs = None
         self.outputs = None
@@ -66,12 +79,11 @@ class SavedState:
 
     @staticmethod
     def _raise_error(msg):
-        logger = get_pytwin_logger()
-        logger.error(msg)
+        _LOGGER.error(msg)
         raise SavedStateError(msg)
 
     def _check_given_dict(self, json_dict):
-        requested_keys = [self.ID_KEY, self.TIME_KEY, self.INPUTS_KEY, self.OUTPUTS_KEY, self.PARAMETERS_KEY]
+        requested_keys = (self.ID_KEY, self.TIME_KEY, self.INPUTS_KEY, self.OUTPUTS_KEY, self.PARAMETERS_KEY)
         for key in requested_keys:
             if key not in json_dict:
                 msg = f"Metadata is corrupted. No '{key}' key was found."
@@ -98,10 +110,17 @@ class SavedStateRegistry:
         self._model_id = None
         self._model_name = None
         self._saved_states = None
-
-        self._check_model_dir_exists(model_id, model_name)
+        self._times = []
+        self._times_array = None
+        self._times_are_sorted = True
+        self._registry_stamp = None
+        self._backup_folderpath = None
+
+        model_dir = _model_paths(get_pytwin_working_dir(), model_name, model_id)[0]
+        self._check_model_dir_exists(model_dir, model_id, model_name)
         self._model_id = model_id
         self._model_name = model_name
+        self._backup_folderpath = os.path.join(model_dir, "backup")
 
         # Backup folder creation
         if not os.path.exists(self.backup_folderpath):
@@ -109,27 +128,49 @@ class SavedStateRegistry:
 
     @property
     def backup_folderpath(self):
-        model = Model()
-        model._id = self._model_id
-        model._model_name = self._model_name
-        return os.path.join(model.model_dir, "backup")
+        return self._backup_folderpath
 
     @property
     def registry_filename(self):
-        return "registry.json"
+        return "registry.jsonl"
 
     @property
     def registry_filepath(self):
         return os.path.join(self.backup_folderpath, self.registry_filename)
 
+    @property
+    def legacy_registry_filepath(self):
+        """Path to the registry file written by previous versions (single JSON document)."""
+        return os.path.join(self.backup_folderpath, "registry.json")
+
+    def is_registry_of(self, model_id: str, model_name: str):
+        """
+        Return whether this registry is the one of the given model, within the current working directory.
+        """
+        if model_id != self._model_id or model_name != self._model_name:
+            return False
+        model_dir = _model_paths(get_pytwin_working_dir(), model_name, model_id)[0]
+        return self._backup_folderpath == os.path.join(model_dir, "backup")
+
     def append_saved_state(self, ss: SavedState):
+        # Saved states in memory stay up to date only if nobody else wrote the registry file since it was last read
+        # or written by this registry
+        registry_stamp = self._registry_file_stamp()
+        in_sync = registry_stamp == self._registry_stamp and (self._saved_states is not None or registry_stamp is None)
         if self._saved_states is None:
             self._saved_states = []
         self._saved_states.append(ss)
-        self._write_registry()
+        if self._times and ss.time < self._times[-1]:
+            self._times_are_sorted = False
+        self._times.append(ss.time)
+        self._times_array = None
+        self._write_registry(ss)
+        self._registry_stamp = self._registry_file_stamp() if in_sync else None
 
     def extract_saved_state(self, simulation_time: float, epsilon: float):
-        self._read_registry()
+        # Only read the registry file again if it changed since it was last read or written by this registry
+        if self._saved_states is None or self._registry_file_stamp() != self._registry_stamp:
+            self._read_registry()
         return self._search_saved_state(simulation_time, epsilon)
 
     def return_saved_state_filepath(self, ss: SavedState):
@@ -137,15 +178,10 @@ class SavedStateRegistry:
 
     @staticmethod
     def _raise_error(msg):
-        logger = get_pytwin_logger()
-        logger.error(msg)
+        _LOGGER.error(msg)
         raise SavedStateRegistryError(msg)
 
-    def _check_model_dir_exists(self, model_id: str, model_name: str):
-        model = Model()
-        model._id = model_id
-        model._model_name = model_name
-        wd = model.model_dir
+    def _check_model_dir_exists(self, wd: str, model_id: str, model_name: str):
         if not os.path.exists(wd):
             msg = f"Model directory ({wd}) does not exist."
             msg += "\nUse an existing model ID or model name."
@@ -154,20 +190,12 @@ class SavedStateRegistry:
             self._raise_error(msg)
 
     def _check_given_dict(self, json_dict):
-        requested_keys = [self.SAVED_STATES_KEY]
+        requested_keys = (self.SAVED_STATES_KEY,)
         for key in requested_keys:
-            if key not in requested_keys:
-                if key not in json_dict:
-                    msg = f"Metadata is corrupted. No '{key}' key was found."
-                    msg += f"\n{json_dict}"
-                    self._raise_error(msg)
-
-    def _dump(self):
-        var = dict()
-        var[self.SAVED_STATES_KEY] = []
-        for ss in self._saved_states:
-            var[self.SAVED_STATES_KEY].append(ss.dump())
-        return var
+            if key not in json_dict:
+                msg = f"Metadata is corrupted. No '{key}' key was found."
+                msg += f"\n{json_dict}"
+                self._raise_error(msg)
 
     def _load(self, json_dict: dict):
         self._check_given_dict(json_dict)
@@ -177,47 +205,95 @@ class SavedStateRegistry:
             ss = SavedState()
             ss.load(ss_dict)
             self._saved_states.append(ss)
+        self._times = [ss.time for ss in self._saved_states]
+        self._times_array = None
+        self._times_are_sorted = all(t0 <= t1 for t0, t1 in zip(self._times, self._times[1:]))
+
+    def _registry_file_stamp(self):
+        """
+        Return the modification time and size of the registry file, or ``None`` if there is no registry file yet.
+        """
+        for filepath in (self.registry_filepath, self.legacy_registry_filepath):
+            try:
+                stat = os.stat(filepath)
+            except FileNotFoundError:
+                continue
+            return stat.st_mtime_ns, stat.st_size
+        return None
 
     def _read_registry(self):
         try:
-            with open(self.registry_filepath, "r", encoding="utf-8") as fp:
-                self._load(json_dict=json.load(fp))
+            # The stamp is taken before reading so that a concurrent write triggers another read on next extraction
+            registry_stamp = self._registry_file_stamp()
+            if not os.path.exists(self.registry_filepath) and os.path.exists(self.legacy_registry_filepath):
+                with open(self.legacy_registry_filepath, "r", encoding="utf-8") as fp:
+                    self._load(json_dict=json.load(fp))
+                self._registry_stamp = registry_stamp
+                return
+            # Registry file holds one saved state metadata per line
+            with open(self.registry_filepath, "rb") as fp:
+                lines = [line for line in fp if line.strip()]
+            try:
+                saved_states = [_json_loads(line) for line in lines]
+            except ValueError:
+                # orjson rejects the NaN and Infinity values that the json module writes
+                saved_states = [json.loads(line) for line in lines]
+            self._load(json_dict={self.SAVED_STATES_KEY: saved_states})
+            self._registry_stamp = registry_stamp
         except Exception as e:
             msg = f"Something went wrong while reading the registry file {self.registry_filename}."
             msg += f"\n{str(e)}"
             self._raise_error(msg)
 
+    def _migrate_legacy_registry(self):
+        """
+        Copy the saved states of the registry file written by previous versions into the registry file, so that
+        they can still be found once new saved states are appended.
+        """
+        with open(self.legacy_registry_filepath, "r", encoding="utf-8") as fp:
+            json_dict = json.load(fp)
+        self._check_given_dict(json_dict)
+        with open(self.registry_filepath, "w", encoding="utf-8") as fp:
+            for ss_dict in json_dict[self.SAVED_STATES_KEY]:
+                fp.write(json.dumps(ss_dict, separators=(",", ":")) + "\n")
+
     def _search_saved_state(self, evaluation_time: float, epsilon: float):
-        time_instants = np.array([ss.time for ss in self._saved_states])
+        # NumPy is only needed when searching saved states
+        import numpy as np
+
+        # Saved state times are kept alongside the saved states and only converted again once the registry changed
+        if self._times_array is None:
+            self._times_array = np.asarray(self._times, dtype=np.float64)
+        time_instants = self._times_array
         tl = evaluation_time - epsilon
         tr = evaluation_time + epsilon
-        idx = np.where((time_instants > tl) & (time_instants < tr))
-
-        if len(idx[0]) == 0:
+        if self._times_are_sorted:
+            # Saved states are usually appended chronologically, bisect the times in that case
+            left = int(np.searchsorted(time_instants, tl, side="right"))
+            right = int(np.searchsorted(time_instants, tr, side="left"))
+            idx = range(left, right)
+        else:
+            idx = np.where((time_instants > tl) & (time_instants < tr))[0]
+
+        if len(idx) == 0:
             msg = f"No state at simulation time {evaluation_time} was found."
             self._raise_error(msg)
 
-        if len(idx[0]) > 1:
-            times = []
-            for i in range(len(idx[0])):
-                ss = self._saved_states[idx[0][i]]
-                times.append(ss.time)
-            msg = (
-                f"[SavedStateRegistry]Multiple saved states were found. The first one is "
-                f"\nused at simulation time {times[0]}."
-            )
-            logger = get_pytwin_logger()
-            logger.warning(msg)
+        if len(idx) > 1 and pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_WARNING):
+            msg = "[SavedStateRegistry]Multiple saved states were found. The first one is \nused at simulation time %s."
+            _LOGGER.warning(msg, self._saved_states[idx[0]].time)
 
-        idx = idx[0][0]
+        idx = idx[0]
 
         return self._saved_states[idx]
 
-    def _write_registry(self):
+    def _write_registry(self, ss: SavedState):
         try:
-            # Save current registry to registry file
-            with open(self.registry_filepath, "w", encoding="utf-8") as fp:
-                json.dump(self._dump(), fp, indent=4)
+            if not os.path.exists(self.registry_filepath) and os.path.exists(self.legacy_registry_filepath):
+                self._migrate_legacy_registry()
+            # Append the saved state metadata to the registry file rather than rewriting all the saved states
+            with open(self.registry_filepath, "a", encoding="utf-8") as fp:
+                fp.write(json.dumps(ss.dump(), separators=(",", ":")) + "\n")
         except Exception as e:
             msg = f"Something went wrong while writing the registry file {self.registry_filename}."
             msg += f"\n{str(e)}"
@@ -90,10 +90,14 @@ class TwinModel(Model):
         self._initialization_time = None
         self._instantiation_time = None
         self._inputs = None
+        self._input_names_set = None
         self._model_filepath = None
         self._outputs = None
+        self._output_column_names = None
         self._parameters = None
+        self._parameter_names_set = None
         self._ss_registry = None
+        self._loaded_ss_registry = None
         self._twin_runtime = None
         self._tbrom_info = None
         self._tbroms = None
@@ -473,6 +477,21 @@ class TwinModel(Model):
         if pytwin_level == PyTwinLogLevel.PYTWIN_LOG_CRITICAL:
             return LogLevel.TWIN_LOG_FATAL
 
+    def _get_saved_state_registry(self, model_id: str):
+        """
+        Return the saved state registry of the given model ID. Registries of this twin model and of the last loaded
+        model ID are kept, so that their saved states are not read again from the registry file if it did not change.
+        """
+        for ss_registry in (self._ss_registry, self._loaded_ss_registry):
+            if ss_registry is not None and ss_registry.is_registry_of(model_id, self.name):
+                return ss_registry
+        ss_registry = SavedStateRegistry(model_id=model_id, model_name=self.name)
+        if model_id == self.id:
+            self._ss_registry = ss_registry
+        else:
+            self._loaded_ss_registry = ss_registry
+        return ss_registry
+
     def _initialize_evaluation(
         self, parameters: dict = None, inputs: dict = None, field_inputs: dict = None, runtime_init: bool = True
     ):
@@ -585,6 +604,9 @@ class TwinModel(Model):
             self._outputs = dict()
             for name in self._twin_runtime.twin_get_output_names():
                 self._outputs[name] = None
+            self._input_names_set = frozenset(self._inputs)
+            self._output_column_names = ["Time"] + list(self._outputs)
+            self._parameter_names_set = frozenset(self._parameters)
 
             # Retrieve tbrom_info
             tbrom_info = self._twin_runtime.twin_get_visualization_resources()
@@ -644,10 +666,10 @@ class TwinModel(Model):
 
     def _update_inputs(self, inputs: dict):
         """Update input values with the given dictionary."""
-        for name, value in inputs.items():
-            if name in self._inputs:
-                self._inputs[name] = value
-                self._twin_runtime.twin_set_input_by_name(input_name=name, value=value)
+        for name in inputs.keys() & self._input_names_set:
+            value = inputs[name]
+            self._inputs[name] = value
+            self._twin_runtime.twin_set_input_by_name(input_name=name, value=value)
 
     def _update_outputs(self):
         """Update output values with twin model results at the current evaluation time."""
@@ -659,10 +681,10 @@ class TwinModel(Model):
 
     def _update_parameters(self, parameters: dict):
         """Update parameter values with the given dictionary."""
-        for name, value in parameters.items():
-            if name in self._parameters:
-                self._parameters[name] = value
-                self._twin_runtime.twin_set_param_by_name(param_name=name, value=value)
+        for name in parameters.keys() & self._parameter_names_set:
+            value = parameters[name]
+            self._parameters[name] = value
+            self._twin_runtime.twin_set_param_by_name(param_name=name, value=value)
 
     def _tbrom_resource_directory(self, rom_name: str):
         """
@@ -1174,7 +1196,7 @@ class TwinModel(Model):
             self._raise_error(msg)
 
         t0 = _inputs_df["Time"][0]
-        if not np.isclose(t0, 0.0, atol=np.spacing(0.0)):
+        if t0 != 0.0:
             msg = self._error_msg_no_time_zero_in_batch(t0)
             self._raise_error(msg)
 
@@ -1200,10 +1222,8 @@ class TwinModel(Model):
         try:
             # Ensure SDK conventions are fulfilled
             _inputs_df = self._create_dataframe_inputs(_inputs_df)
-            _output_col_names = ["Time"] + list(self._outputs.keys())
-
             return self._twin_runtime.twin_simulate_batch_mode(
-                input_df=_inputs_df, output_column_names=_output_col_names
+                input_df=_inputs_df, output_column_names=self._output_column_names
             )
         except Exception as e:
             msg = f"Something went wrong during batch evaluation:"
@@ -1599,8 +1619,8 @@ class TwinModel(Model):
         self._log_key = "LoadState"
 
         try:
-            # Search for existing state in registry
-            ss_registry = SavedStateRegistry(model_id=model_id, model_name=self.name)
+            # Search for existing state in registry, reusing the registry already used for this model ID
+            ss_registry = self._get_saved_state_registry(model_id)
             ss = ss_registry.extract_saved_state(evaluation_time, epsilon)
             ss_filepath = ss_registry.return_saved_state_filepath(ss)
 
@@ -1645,8 +1665,7 @@ class TwinModel(Model):
 
         try:
             # Lazy init saved state registry for this twin model
-            if self._ss_registry is None:
-                self._ss_registry = SavedStateRegistry(model_id=self.id, model_name=self.name)
+            self._get_saved_state_registry(self.id)
 
             # Store saved state metadata
             ss = SavedState()
@@ -30,8 +30,8 @@ Examples
 '/home/user/.local/share/TwinExamples/twin/CoupleClutches_22R2_other.twin'
 """
 
-import ast
 import csv
+import html
 import os
 import shutil
 import tempfile
@@ -80,19 +80,29 @@ def _retrieve_file(url, filename, directory, destination=None):
         destination = EXAMPLES_PATH
     local_path = os.path.join(destination, directory, os.path.basename(filename))
     local_path_no_zip = local_path.replace(".zip", "")
-    if os.path.isfile(local_path_no_zip) or os.path.isdir(local_path_no_zip):
+    if os.path.isdir(local_path_no_zip):
+        return local_path_no_zip
+    # Empty files are left over by interrupted downloads of previous versions and are downloaded again
+    if os.path.isfile(local_path_no_zip) and os.path.getsize(local_path_no_zip) > 0:
         return local_path_no_zip
 
     urlretrieve = urllib.request.urlretrieve
 
+    # Several processes may download the same example at the same time
     dirpath = os.path.dirname(local_path)
-    if not os.path.isdir(destination):
-        os.mkdir(destination)
-    if not os.path.isdir(dirpath):
-        os.makedirs(dirpath)
-
-    # Perform download
-    _, resp = urlretrieve(url, local_path)
+    os.makedirs(dirpath, exist_ok=True)
+
+    # Perform download into a temporary file that is moved in place once complete, so that the file found at the
+    # local path is never partially written
+    fd, tmp_path = tempfile.mkstemp(dir=dirpath, prefix=f".{os.path.basename(local_path)}.", suffix=".part")
+    os.close(fd)
+    try:
+        _, resp = urlretrieve(url, tmp_path)
+        os.replace(tmp_path, local_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     return local_path
 
 
@@ -115,7 +125,9 @@ def _retrieve_folder(url, directory, destination=None):
 
     for line in data:
         if "js-navigation-open Link--primary" in line:
-            filename = ast.literal_eval(line[line.find("title=") + len("title=") : line.rfind(" data-pjax")])
+            start = line.find("title=") + len("title=")
+            quote = line[start]
+            filename = html.unescape(line[start + 1 : line.index(quote, start + 1)])
             _download_file(directory, filename, destination)
     return local_path
 
@@ -23,11 +23,14 @@
 import atexit
 from enum import Enum
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
+import queue
+import secrets
 import shutil
 import sys
 import tempfile
-import uuid
+import threading
 
 
 class PyTwinLogLevel(Enum):
@@ -77,14 +80,105 @@ class PyTwinLogOption(Enum):
     PYTWIN_LOGGING_OPT_NOLOGGING = 2  # No logging
 
 
+class _BlockBufferedFileHandler(logging.FileHandler):
+    """
+    Provides a file handler that lets records accumulate in the file buffer instead of flushing after each record.
+    The buffer is written to disk when it is full, every ``flush_interval`` seconds and when the handler is closed.
+    """
+
+    def __init__(self, filename: str, mode: str = "w", buffer_size: int = 65536, flush_interval: float = 1.0):
+        self._buffer_size = buffer_size
+        super().__init__(filename=filename, mode=mode)
+        self._flush_interval = flush_interval
+        self._stop_flush = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_periodically, name="pytwin_log_flush", daemon=True)
+        self._flush_thread.start()
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self._buffer_size, encoding=self.encoding, errors=self.errors
+        )
+
+    def _flush_periodically(self):
+        while not self._stop_flush.wait(self._flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        # Same as FileHandler.emit, without the flush after each record
+        if self.stream is None and (self.mode != "w" or not self._closed):
+            self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_flush.set()
+        self._flush_thread.join()
+        super().close()
+
+
 class PyTwinSettingsError(Exception):
     def __str__(self):
         return f"[pyTwin][SettingsError] {self.args[0]}"
 
 
+def _check_log_level_is_valid(level: PyTwinLogLevel):
+    if not isinstance(level, PyTwinLogLevel):
+        msg = "Error occurred while setting PyTwin logging level."
+        msg += f"\nUse the {PyTwinLogLevel} enum to set the log level."
+        raise PyTwinSettingsError(msg)
+
+
+def _check_log_option_is_valid(option: PyTwinLogOption):
+    if not isinstance(option, PyTwinLogOption):
+        msg = "Error occurred while setting PyTwin logging option."
+        msg += f"\nUse the {PyTwinLogOption} enum to set the logging option."
+        raise PyTwinSettingsError(msg)
+
+
+def _check_log_buffered_is_valid(buffered: bool):
+    if not isinstance(buffered, bool):
+        msg = "Error occurred while setting PyTwin logging."
+        msg += f"\n'buffered' argument must be Boolean (provided: {buffered})."
+        raise PyTwinSettingsError(msg)
+
+
+def _check_wd_path_is_valid(wd: str):
+    if wd is None:
+        msg = "Error occurred while setting the PyTwin working directory."
+        msg += "\nGiven path is None. Provide a valid path."
+        raise PyTwinSettingsError(msg)
+    if not os.path.exists(wd):
+        # Check if the provided working director can be created if it does not exist.
+        parent_dir, _ = os.path.split(wd)
+        if not os.path.isdir(parent_dir):
+            msg = f"Error occurred while setting the PyTwin working directory"
+            msg += f"\nSome parent directory ({parent_dir}) in the provided path ({wd}) does not exist."
+            msg += f"\nProvide a folder path in which all parents exist."
+            raise PyTwinSettingsError(msg)
+        if not os.access(parent_dir, os.W_OK):
+            msg = f"Error occurred while setting the PyTwin working directory."
+            msg += f"\nParent directory ({parent_dir}) does not have write permission."
+            msg += f"\nProvide write permission to '{parent_dir}'."
+            raise PyTwinSettingsError(msg)
+
+
+def _check_wd_erase_is_valid(erase: bool):
+    if not isinstance(erase, bool):
+        msg = "Error occurred while setting the PyTwin working directory"
+        msg += f"\n'erase' argument must be Boolean (provided: {erase})."
+        raise PyTwinSettingsError(msg)
+
+
 def modify_pytwin_logging(
     new_option: PyTwinLogOption = PyTwinLogOption.PYTWIN_LOGGING_OPT_FILE,
     new_level: PyTwinLogLevel = PyTwinLogLevel.PYTWIN_LOG_INFO,
+    buffered: bool = None,
 ):
     """
     Modify global PyTwin logging. You can choose to take these actions:
@@ -103,12 +197,18 @@ def modify_pytwin_logging(
         Option to use for PyTwin logging.
     new_level: PyTwinLogLevel
         Level to use for PyTwin logging.
+    buffered: bool, optional
+        Whether log records redirected to the PyTwin log file are buffered and written by a background thread.
+        The default is ``None``, in which case the current setting is kept (PyTwin starts unbuffered). When ``True``,
+        logging calls only enqueue records, so they are not slowed down by disk latency, and records are written to
+        disk in blocks. The log file is up to date once logging is modified again or the Python process exits.
 
     Raises
     ------
     PyTwinSettingsError
         If ``new_option`` is not a valid ``PyTwinLogOption`` attribute.
         If ``new_level`` is not a valid ``PyTwinLogLevel`` attribute.
+        If ``buffered`` is not a Boolean value.
 
     Examples
     --------
@@ -126,39 +226,21 @@ def modify_pytwin_logging(
     >>> # Disable logging
     >>> from pytwin import modify_pytwin_logging, PYTWIN_LOGGING_OPT_NOLOGGING
     >>> modify_pytwin_logging(PYTWIN_LOGGING_OPT_NOLOGGING)
+    >>> #
+    >>> # Write log file records from a background thread
+    >>> modify_pytwin_logging(new_option=PYTWIN_LOGGING_OPT_FILE, buffered=True)
     """
 
-    def _check_log_level_is_valid(_level: PyTwinLogLevel):
-        if isinstance(_level, PyTwinLogLevel):
-            if _level.name not in PyTwinLogLevel.__members__:
-                msg = "Error occurred while setting PyTwin logging level."
-                msg += f"\nProvided log level is unknown (provided: {_level}.)"
-                msg += f"\nChoose a value from the {PyTwinLogLevel.__members__} enum."
-                raise PyTwinSettingsError(msg)
-        else:
-            msg = "Error occurred while setting PyTwin logging level."
-            msg += f"\nUse the {PyTwinLogLevel} enum to set the log level."
-            raise PyTwinSettingsError(msg)
-
-    def _check_log_option_is_valid(_option: PyTwinLogOption):
-        if isinstance(_option, PyTwinLogOption):
-            if _option.name not in PyTwinLogOption.__members__:
-                msg = "Error occurred while setting PyTwin logging option."
-                msg += f"\nProvided logging option is unknown (provided: {_option}.)"
-                msg += f"\nChoose a value from the {PyTwinLogOption.__members__} enum."
-                raise PyTwinSettingsError(msg)
-        else:
-            msg = "Error occurred while setting PyTwin logging option."
-            msg += f"\nUse the {PyTwinLogOption} enum to set the logging option."
-            raise PyTwinSettingsError(msg)
-
     if new_option is not None:
         _check_log_option_is_valid(new_option)
 
     if new_level is not None:
         _check_log_level_is_valid(new_level)
 
-    PYTWIN_SETTINGS.modify_logging(new_option=new_option, new_level=new_level)
+    if buffered is not None:
+        _check_log_buffered_is_valid(buffered)
+
+    PYTWIN_SETTINGS.modify_logging(new_option=new_option, new_level=new_level, buffered=buffered)
 
 
 def modify_pytwin_working_dir(new_path: str, erase: bool = True):
@@ -197,38 +279,22 @@ def modify_pytwin_working_dir(new_path: str, erase: bool = True):
     >>> modify_pytwin_working_dir('path_to_new_working_dir', erase=False)
     """
 
-    def _check_wd_path_is_valid(_wd: str):
-        if new_path is None:
-            msg = "Error occurred while setting the PyTwin working directory."
-            msg += "\nGiven path is None. Provide a valid path."
-            raise PyTwinSettingsError(msg)
-        parent_dir = os.path.split(_wd)[0]
-        if not os.path.exists(_wd):
-            # Check if the provided working director can be created if it does not exist.
-            if not os.path.exists(parent_dir):
-                msg = f"Error occurred while setting the PyTwin working directory"
-                msg += f"\nSome parent directory ({parent_dir}) in the provided path ({_wd}) does not exist."
-                msg += f"\nProvide a folder path in which all parents exist."
-                raise PyTwinSettingsError(msg)
-            if not os.access(parent_dir, os.W_OK):
-                msg = f"Error occurred while setting the PyTwin working directory."
-                msg += f"\nParent directory ({parent_dir}) does not have write permission."
-                msg += f"\nProvide write permission to '{parent_dir}'."
-                raise PyTwinSettingsError(msg)
-
-    def _check_wd_erase_is_valid(_erase: bool):
-        if not isinstance(_erase, bool):
-            msg = "Error occurred while setting the PyTwin working directory"
-            msg += f"\n'erase' argument must be Boolean (provided: {_erase})."
-            raise PyTwinSettingsError(msg)
-
     _check_wd_path_is_valid(new_path)
     _check_wd_erase_is_valid(erase)
     PYTWIN_SETTINGS.modify_wd_dir(new_path=new_path, erase=erase)
 
 
 def pytwin_logging_is_enabled():
-    return PYTWIN_SETTINGS.LOGGING_OPTION != PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING
+    return _PyTwinSettings.LOGGING_OPTION is not PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING
+
+
+def pytwin_logging_is_enabled_for(level: PyTwinLogLevel):
+    """
+    Check if a message of the given level is emitted by the PyTwin logger.
+
+    Use this check to skip building log messages that would be discarded anyway.
+    """
+    return pytwin_logging_is_enabled() and _PyTwinSettings._LOGGER.isEnabledFor(level.value)
 
 
 def get_pytwin_logger():
@@ -263,8 +329,9 @@ def reinit_settings_for_unit_tests():
     # Mutable attributes init
     _PyTwinSettings.LOGGING_OPTION = None
     _PyTwinSettings.LOGGING_LEVEL = None
+    _PyTwinSettings.LOGGING_BUFFERED = False
     _PyTwinSettings.WORKING_DIRECTORY_PATH = None
-    logging.getLogger(_PyTwinSettings.LOGGER_NAME).handlers.clear()
+    _PyTwinSettings._clear_pytwin_logger_handlers()
     PYTWIN_SETTINGS._initialize(keep_session_id=True)
     return PYTWIN_SETTINGS.SESSION_ID
 
@@ -279,6 +346,7 @@ class _PyTwinSettings(object):
     # Mutable constants
     LOGGING_OPTION = None
     LOGGING_LEVEL = None
+    LOGGING_BUFFERED = False
     SESSION_ID = None
     WORKING_DIRECTORY_PATH = None
     TEMP_WORKING_DIRECTORY_PATH = None
@@ -290,12 +358,21 @@ class _PyTwinSettings(object):
     TEMP_WD_NAME = ".temp"
     PYTWIN_START_MSG = "pytwin starts!"
     PYTWIN_END_MSG = "pytwin ends!"
+    LOGGING_FORMAT = "[%(asctime)s][pytwin] %(levelname)s: %(message)s"
+    LOGGING_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+    LOGGING_BUFFER_SIZE = 65536
+    LOGGING_FLUSH_INTERVAL = 1.0  # seconds
+
+    # Loggers are never released by the logging module, so the PyTwin logger is fetched once.
+    _LOGGER = logging.getLogger(LOGGER_NAME)
+    _LOG_FORMATTER = logging.Formatter(fmt=LOGGING_FORMAT, datefmt=LOGGING_DATE_FORMAT)
+    _LOG_LISTENER = None
 
     @property
     def logfile(self):
-        if _PyTwinSettings.LOGGING_OPTION == PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING:
+        if _PyTwinSettings.LOGGING_OPTION is PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING:
             return None
-        if _PyTwinSettings.LOGGING_OPTION == PyTwinLogOption.PYTWIN_LOGGING_OPT_CONSOLE:
+        if _PyTwinSettings.LOGGING_OPTION is PyTwinLogOption.PYTWIN_LOGGING_OPT_CONSOLE:
             return None
         if _PyTwinSettings.WORKING_DIRECTORY_PATH is None:
             msg = "Working directory has not been set."
@@ -311,7 +388,7 @@ class _PyTwinSettings(object):
         if _PyTwinSettings.LOGGING_OPTION is None:
             msg = "Logging option has not been set."
             raise PyTwinSettingsError(msg)
-        return logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+        return _PyTwinSettings._LOGGER
 
     @property
     def working_dir(self):
@@ -327,38 +404,61 @@ class _PyTwinSettings(object):
     @staticmethod
     def _add_default_file_handler_to_pytwin_logger(filepath: str, level: PyTwinLogLevel, mode: str = "w"):
         # Create logging handler
-        formatter = logging.Formatter(
-            fmt="[%(asctime)s][pytwin] %(levelname)s: %(message)s", datefmt="%m/%d/%Y %I:%M:%S %p"
-        )
-        log_handler = logging.FileHandler(filename=filepath, mode=mode)
+        if _PyTwinSettings.LOGGING_BUFFERED:
+            log_handler = _BlockBufferedFileHandler(
+                filename=filepath,
+                mode=mode,
+                buffer_size=_PyTwinSettings.LOGGING_BUFFER_SIZE,
+                flush_interval=_PyTwinSettings.LOGGING_FLUSH_INTERVAL,
+            )
+        else:
+            log_handler = logging.FileHandler(filename=filepath, mode=mode)
         log_handler.setLevel(level.value)
-        log_handler.setFormatter(fmt=formatter)
+        log_handler.setFormatter(fmt=_PyTwinSettings._LOG_FORMATTER)
+        if _PyTwinSettings.LOGGING_BUFFERED:
+            # Hand records over to a background thread that writes them to the file
+            log_queue = queue.SimpleQueue()
+            _PyTwinSettings._LOG_LISTENER = QueueListener(log_queue, log_handler, respect_handler_level=True)
+            _PyTwinSettings._LOG_LISTENER.start()
+            log_handler = QueueHandler(log_queue)
+            log_handler.setLevel(level.value)
         # Add handler to pytwin logger
-        logger = logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+        logger = _PyTwinSettings._LOGGER
         logger.setLevel(level.value)
         logger.addHandler(log_handler)
 
     @staticmethod
     def _add_default_stream_handler_to_pytwin_logger(level: PyTwinLogLevel):
         # Create logging handler
-        formatter = logging.Formatter(
-            fmt="[%(asctime)s][pytwin] %(levelname)s: %(message)s", datefmt="%m/%d/%Y %I:%M:%S %p"
-        )
         log_handler = logging.StreamHandler()
         log_handler.setLevel(level.value)
-        log_handler.setFormatter(fmt=formatter)
+        log_handler.setFormatter(fmt=_PyTwinSettings._LOG_FORMATTER)
         # Add handler to pytwin logger
-        logger = logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+        logger = _PyTwinSettings._LOGGER
         logger.setLevel(level.value)
         logger.addHandler(log_handler)
 
     @staticmethod
-    def _initialize(keep_session_id: bool):
-        pytwin_logger = logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+    def _clear_pytwin_logger_handlers():
+        """
+        Remove all handlers from the PyTwin logger. Pending buffered records are written before their file is closed.
+        """
+        pytwin_logger = _PyTwinSettings._LOGGER
+        if _PyTwinSettings._LOG_LISTENER is not None:
+            _PyTwinSettings._LOG_LISTENER.stop()
+            for handler in _PyTwinSettings._LOG_LISTENER.handlers:
+                handler.close()
+            _PyTwinSettings._LOG_LISTENER = None
+        for handler in pytwin_logger.handlers:
+            handler.close()
         pytwin_logger.handlers.clear()
 
+    @staticmethod
+    def _initialize(keep_session_id: bool):
+        _PyTwinSettings._clear_pytwin_logger_handlers()
+
         if not keep_session_id:
-            _PyTwinSettings.SESSION_ID = f"{uuid.uuid4()}"[0:24].replace("-", "")
+            _PyTwinSettings.SESSION_ID = secrets.token_hex(10)
 
         _PyTwinSettings._initialize_wd()
         _PyTwinSettings._initialize_logging()
@@ -391,16 +491,16 @@ class _PyTwinSettings(object):
     @staticmethod
     def _migration_due_to_new_wd(old_path: str, new_path: str):
         # Migrate file handler found in pytwin_logger
-        pytwin_logger = logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+        pytwin_logger = _PyTwinSettings._LOGGER
 
-        has_file_handler = None
+        has_file_handler = _PyTwinSettings._LOG_LISTENER is not None
         for handler in pytwin_logger.handlers:
             if isinstance(handler, logging.FileHandler):
                 has_file_handler = True
 
         if has_file_handler:
             # Clear existing handlers, copy old log content into new one, add a new file handler to PyTwin logger
-            pytwin_logger.handlers.clear()
+            _PyTwinSettings._clear_pytwin_logger_handlers()
             old_logfile_path = os.path.join(old_path, _PyTwinSettings.LOGGING_FILE_NAME)
             new_logfile_path = os.path.join(new_path, _PyTwinSettings.LOGGING_FILE_NAME)
             shutil.copyfile(old_logfile_path, new_logfile_path)
@@ -436,30 +536,40 @@ class _PyTwinSettings(object):
         old_path = _PyTwinSettings.WORKING_DIRECTORY_PATH
 
         # Check new directory
-        if os.path.exists(new_path):
-            if len(os.listdir(new_path)) > 0:
-                # New directory exists and it is not empty
-                if erase:
-                    shutil.rmtree(new_path)
-                    os.mkdir(new_path)
-        else:
+        try:
+            with os.scandir(new_path) as it:
+                is_empty = next(it, None) is None
+        except FileNotFoundError:
             # New directory does not exist
             os.mkdir(new_path)
+        else:
+            if not is_empty and erase:
+                # New directory exists and it is not empty
+                shutil.rmtree(new_path)
+                os.mkdir(new_path)
 
         _PyTwinSettings.WORKING_DIRECTORY_PATH = new_path
         if old_path is not None:
             _PyTwinSettings._migration_due_to_new_wd(old_path, new_path)
 
     @staticmethod
-    def modify_logging(new_option: PyTwinLogOption, new_level: PyTwinLogLevel):
-        pytwin_logger = logging.getLogger(_PyTwinSettings.LOGGER_NAME)
+    def modify_logging(new_option: PyTwinLogOption, new_level: PyTwinLogLevel, buffered: bool = None):
+        pytwin_logger = _PyTwinSettings._LOGGER
+
+        # Modifications in case of new buffering mode (existing log file handler is replaced)
+        reopen_log_file = False
+        if buffered is not None:
+            if buffered != _PyTwinSettings.LOGGING_BUFFERED:
+                _PyTwinSettings.LOGGING_BUFFERED = buffered
+                reopen_log_file = _PyTwinSettings.LOGGING_OPTION is PyTwinLogOption.PYTWIN_LOGGING_OPT_FILE
 
         # Modifications in case of new option
         if new_option is not None:
             if new_option != _PyTwinSettings.LOGGING_OPTION:
                 # Update PyTwin settings and clear existing handles
                 _PyTwinSettings.LOGGING_OPTION = new_option
-                pytwin_logger.handlers.clear()
+                _PyTwinSettings._clear_pytwin_logger_handlers()
+                reopen_log_file = False
                 # Create new handles if needed
                 if new_option == PyTwinLogOption.PYTWIN_LOGGING_OPT_FILE:
                     _PyTwinSettings._add_default_file_handler_to_pytwin_logger(
@@ -471,6 +581,14 @@ class _PyTwinSettings(object):
                 if new_option == PyTwinLogOption.PYTWIN_LOGGING_OPT_CONSOLE:
                     _PyTwinSettings._add_default_stream_handler_to_pytwin_logger(level=_PyTwinSettings.LOGGING_LEVEL)
 
+        if reopen_log_file:
+            _PyTwinSettings._clear_pytwin_logger_handlers()
+            _PyTwinSettings._add_default_file_handler_to_pytwin_logger(
+                filepath=os.path.join(_PyTwinSettings.WORKING_DIRECTORY_PATH, _PyTwinSettings.LOGGING_FILE_NAME),
+                level=_PyTwinSettings.LOGGING_LEVEL,
+                mode="a",
+            )
+
         # Modifications in case of new level
         if new_level is not None:
             if new_level != _PyTwinSettings.LOGGING_LEVEL:
@@ -479,6 +597,9 @@ class _PyTwinSettings(object):
                 pytwin_logger.setLevel(new_level.value)
                 for handler in pytwin_logger.handlers:
                     handler.setLevel(new_level.value)
+                if _PyTwinSettings._LOG_LISTENER is not None:
+                    for handler in _PyTwinSettings._LOG_LISTENER.handlers:
+                        handler.setLevel(new_level.value)
 
 
 PYTWIN_SETTINGS = _PyTwinSettings()  # This instance is here to launch default settings initialization.
@@ -488,9 +609,7 @@ PYTWIN_SETTINGS = _PyTwinSettings()  # This instance is here to launch default s
 def cleanup_temp_pytwin_working_directory():
     pytwin_logger = PYTWIN_SETTINGS.logger
     pytwin_logger.info(PYTWIN_SETTINGS.PYTWIN_END_MSG)
-    for handler in pytwin_logger.handlers:
-        handler.close()
-        pytwin_logger.removeHandler(handler)
+    PYTWIN_SETTINGS._clear_pytwin_logger_handlers()
     try:
         shutil.rmtree(PYTWIN_SETTINGS.TEMP_WORKING_DIRECTORY_PATH)
     except BaseException as e:
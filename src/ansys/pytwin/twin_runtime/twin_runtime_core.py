@@ -1,10 +1,10 @@
 #------------------------------------------------------------------------------
 # (c) 2020-2024 ANSYS, Inc. All rights reserved.
 #------------------------------------------------------------------------------
+import functools
 import json
 import math
 import os
-import platform
 import sys
 import xml.etree.ElementTree as ET
 import zipfile
@@ -18,7 +18,6 @@ from ctypes import (
     c_size_t,
     c_void_p,
     cdll,
-    create_string_buffer,
 )
 from enum import Enum
 from pathlib import Path
@@ -26,7 +25,17 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-if platform.system() == "Windows":
+# orjson is used to decode SDK JSON strings if installed. Both loaders
+# accept bytes directly.
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    _json_loads = json.loads
+
+_IS_WINDOWS = sys.platform == "win32"
+_PATH_SEP = ";" if _IS_WINDOWS else ":"
+
+if _IS_WINDOWS:
     import win32api
 
 from .log_level import LogLevel
@@ -35,6 +44,7 @@ from .twin_runtime_error import (
     PropertyInvalidError,
     PropertyNotApplicableError,
     PropertyNotDefinedError,
+    PropertyStatusFlag,
     TwinRuntimeError,
 )
 
@@ -42,6 +52,24 @@ CUR_DIR = getattr(sys, "_MEIPASS", os.path.abspath(os.path.dirname(__file__)))
 os.environ["TWIN_RUNTIME_SDK"] = CUR_DIR
 default_log_name = "model.log"
 
+# Variable property statuses for which the property getters raise an error
+_PROPERTY_ERROR_STATUSES = frozenset(
+    flag.value
+    for flag in PropertyStatusFlag
+    if flag is not PropertyStatusFlag.TWIN_VARPROP_OK
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_name(name):
+    """
+    Returns the given variable name encoded as bytes. Results are cached
+    since the same names are passed over and over to the SDK.
+    """
+    if type(name) is bytes:
+        return name
+    return name.encode()
+
 
 class TwinStatus(Enum):
     TWIN_STATUS_OK = 0
@@ -94,31 +122,102 @@ class TwinRuntime:
 
     """
 
+    # Instance attributes are declared as slots since they are read at
+    # every call into the SDK
+    __slots__ = (
+        "_twin_status",
+        "_is_model_opened",
+        "_is_model_initialized",
+        "_is_model_instantiated",
+        "_last_time_stop",
+        "_model_name",
+        "_number_parameters",
+        "_number_inputs",
+        "_number_outputs",
+        "_has_default_settings",
+        "_p_end_time",
+        "_p_step_size",
+        "_p_tolerance",
+        "_output_names",
+        "_input_names",
+        "_parameter_names",
+        "model_path",
+        "log_path",
+        "log_level",
+        "_model_path_c",
+        "_log_path_c",
+        "_twin_runtime_library",
+        "_modelPointer",
+        "_c_double_out",
+        "_c_char_p_out",
+        "_inputs_c",
+        "_inputs_np",
+        "_outputs_c",
+        "_outputs_np",
+        "_TwinOpen",
+        "_TwinClose",
+        "_TwinReset",
+        "TwinGetStatusString",
+        "_TwinGetModelName",
+        "_TwinGetNumParameters",
+        "_TwinGetNumInputs",
+        "_TwinGetNumOutputs",
+        "_TwinGetParamNames",
+        "_TwinGetInputNames",
+        "_TwinGetOutputNames",
+        "_TwinGetNumberOfDeployments",
+        "_TwinInstantiate",
+        "_TwinInitialize",
+        "_TwinSetParamByName",
+        "_TwinSetStrParamByName",
+        "_TwinSetParamByIndex",
+        "_TwinGetOutputs",
+        "_TwinSimulate",
+        "_TwinSimulateBatchMode",
+        "_TwinSimulateBatchModeCSV",
+        "_TwinSetInputs",
+        "_TwinSetInputByName",
+        "_TwinSetInputByIndex",
+        "_TwinGetOutputByName",
+        "_TwinGetOutputByIndex",
+        "_TwinGetDefaultSimulationSettings",
+        "_TwinGetVarDataType",
+        "_TwinGetVarUnit",
+        "_TwinGetVarStart",
+        "_TwinGetStrVarStart",
+        "_TwinGetVarMin",
+        "_TwinGetVarMax",
+        "_TwinGetVarNominal",
+        "_TwinGetVarQuantityType",
+        "_TwinGetVarDescription",
+        "_TwinGetVisualizationResources",
+        "_TwinEnableROMImages",
+        "_TwinDisableROMImages",
+        "_TwinEnable3DROMData",
+        "_TwinDisable3DROMData",
+        "_TwinGetRomImageFiles",
+        "_TwinGetNumRomImageFiles",
+        "_TwinGetRomModeCoefFiles",
+        "_TwinGetNumRomModeCoefFiles",
+        "_TwinGetRomSnapshotFiles",
+        "_TwinGetNumRomSnapshotFiles",
+        "_TwinGetDefaultROMImageDirectory",
+        "_TwinGetRomResourcePath",
+        "_TwinSetROMImageDirectory",
+        "_TwinSaveState",
+        "_TwinLoadState",
+        "__weakref__",
+    )
+
     _debug_mode = False
-    _twin_status = None
-    _is_model_opened = False
-    _is_model_initialized = False
-    _is_model_instantiated = False
-    _last_time_stop = 0
-
-    _model_name = None
-    _number_parameters = None
-    _number_inputs = None
-    _number_outputs = None
-
-    _has_default_settings = False
-    _p_end_time = None
-    _p_step_size = None
-    _p_tolerance = None
-
-    _output_names = None
-    _input_names = None
-    _parameter_names = None
-
-    if platform.system() == "Windows":
-        _twin_runtime_library = "TwinRuntimeSDK.dll"
+
+    if _IS_WINDOWS:
+        _twin_runtime_library_name = "TwinRuntimeSDK.dll"
     else:
-        _twin_runtime_library = "libTwinRuntimeSDK.so"
+        _twin_runtime_library_name = "libTwinRuntimeSDK.so"
+
+    # Loaded libraries, keyed by the library path given to load_dll
+    _loaded_libraries = {}
 
     @staticmethod
     def load_dll(twin_runtime_library_path=None):
@@ -136,27 +235,32 @@ class TwinRuntime:
         Returns
         -------
         ctypes.cdll
-            The TwinRuntime loaded library in Python
+            The TwinRuntime loaded library in Python. The library is loaded
+            only once per path and the same handle is returned afterwards.
         """
+        loaded_libraries = TwinRuntime._loaded_libraries
+        if twin_runtime_library_path in loaded_libraries:
+            return loaded_libraries[twin_runtime_library_path]
 
         def _setup_env(sdk_folder_path):
-            if platform.system() == "Windows":
-                sep = ";"
-            else:
-                sep = ":"
             if sdk_folder_path not in os.environ["PATH"]:
                 os.environ["PATH"] = "{}{}{}".format(
-                    sdk_folder_path, sep, os.environ["PATH"]
+                    sdk_folder_path, _PATH_SEP, os.environ["PATH"]
                 )
 
         if twin_runtime_library_path is None:
-            _setup_env(str(CUR_DIR))
-            return cdll.LoadLibrary(
-                os.path.join(str(CUR_DIR), TwinRuntime._twin_runtime_library)
+            _setup_env(CUR_DIR)
+            runtime_library = cdll.LoadLibrary(
+                os.path.join(
+                    CUR_DIR, TwinRuntime._twin_runtime_library_name
+                )
             )
         else:
             _setup_env(os.path.dirname(twin_runtime_library_path))
-            return cdll.LoadLibrary(twin_runtime_library_path)
+            runtime_library = cdll.LoadLibrary(twin_runtime_library_path)
+
+        loaded_libraries[twin_runtime_library_path] = runtime_library
+        return runtime_library
 
     @staticmethod
     def twin_get_api_version():
@@ -184,10 +288,9 @@ class TwinRuntime:
         bool
             True if the TWIN model has binaries for Windows and Linux
         """
-        with zipfile.ZipFile(file_path) as zip_handler:
-            zip_contents = zip_handler.namelist()
-            has_windows = "binaries/win64/" in zip_contents
-            has_linux = "binaries/linux64/" in zip_contents
+        has_windows, has_linux = _read_twin_binaries(
+            *_file_cache_key(file_path)
+        )
 
         return has_windows and has_linux
 
@@ -284,10 +387,9 @@ class TwinRuntime:
             Dictionary indicating if Windows binaries are included (True) or
             not (False), and Linux binaries are included (True) or not (False).
         """
-        with zipfile.ZipFile(file_path) as zip_handler:
-            zip_contents = zip_handler.namelist()
-            has_windows = "binaries/win64/" in zip_contents
-            has_linux = "binaries/linux64/" in zip_contents
+        has_windows, has_linux = _read_twin_binaries(
+            *_file_cache_key(file_path)
+        )
 
         return {"has_windows": has_windows, "has_linux": has_linux}
 
@@ -308,18 +410,7 @@ class TwinRuntime:
             True if the TWIN model is a valid model, False otherwise.
             Twin Builder version used to compile it.
         """
-        twin_runtime_library = TwinRuntime.load_dll()
-        TwinGetVersion = twin_runtime_library.TwinGetVersion
-
-        if type(file_path) is not bytes:
-            file_path = file_path.encode()
-
-        valid_model = c_bool()
-        twin_version = c_char_p()
-        TwinGetVersion(
-            c_char_p(file_path), byref(valid_model), byref(twin_version)
-        )
-        return valid_model.value, twin_version.value.decode()
+        return _read_twin_version(*_file_cache_key(file_path))
 
     @staticmethod
     def twin_get_model_dependencies(file_path):
@@ -339,16 +430,10 @@ class TwinRuntime:
             Dictionary of TWIN model's dependencies and the corresponding
             binaries found.
         """
-        runtime_library = TwinRuntime.load_dll()
-
-        TwinGetModelDependencies = runtime_library.TwinGetModelDependencies
-
-        if type(file_path) is not bytes:
-            file_path = file_path.encode()
-
-        twin_dependencies = c_char_p()
-        TwinGetModelDependencies(c_char_p(file_path), byref(twin_dependencies))
-        twin_dependencies_dict = json.loads(twin_dependencies.value.decode())
+        twin_dependencies = _read_twin_model_dependencies(
+            *_file_cache_key(file_path)
+        )
+        twin_dependencies_dict = _json_loads(twin_dependencies)
         return twin_dependencies_dict
 
     @staticmethod
@@ -466,6 +551,26 @@ class TwinRuntime:
         log_level=LogLevel.TWIN_LOG_WARNING,
         load_model=True,
     ):
+        self._twin_status = None
+        self._is_model_opened = False
+        self._is_model_initialized = False
+        self._is_model_instantiated = False
+        self._last_time_stop = 0
+
+        self._model_name = None
+        self._number_parameters = None
+        self._number_inputs = None
+        self._number_outputs = None
+
+        self._has_default_settings = False
+        self._p_end_time = None
+        self._p_step_size = None
+        self._p_tolerance = None
+
+        self._output_names = None
+        self._input_names = None
+        self._parameter_names = None
+
         model_path = Path(model_path)
         self.log_level = log_level
 
@@ -483,18 +588,40 @@ class TwinRuntime:
             file_name = os.path.splitext(model_path)[0]
             log_path = file_name + ".log"
 
-        self.model_path = str(model_path.absolute()).encode()
-        self.log_path = str(Path(log_path)).encode()
+        self.model_path = model_path.resolve()
+        self.log_path = Path(log_path).resolve()
+        # Paths are encoded once since they are passed to each TwinOpen call
+        self._model_path_c = str(self.model_path).encode()
+        self._log_path_c = str(self.log_path).encode()
 
         # Mapping sdk functions as class methods
         self._modelPointer = c_void_p()
 
+        # Output holders reused by the variable property getters
+        self._c_double_out = c_double()
+        self._c_char_p_out = c_char_p()
+
+        # Input/output buffers reused by twin_set_inputs/twin_get_outputs,
+        # allocated once the number of variables is known
+        self._inputs_c = None
+        self._inputs_np = None
+        self._outputs_c = None
+        self._outputs_np = None
+
         self._TwinOpen = self._twin_runtime_library.TwinOpen
+        self._TwinOpen.argtypes = [
+            c_char_p,
+            POINTER(c_void_p),
+            c_char_p,
+            c_int,
+        ]
         self._TwinOpen.restype = c_int
 
         self._TwinClose = self._twin_runtime_library.TwinClose
+        self._TwinClose.argtypes = [c_void_p]
 
         self._TwinReset = self._twin_runtime_library.TwinReset
+        self._TwinReset.argtypes = [c_void_p]
         self._TwinReset.restype = c_int
 
         self.TwinGetStatusString = (
@@ -504,33 +631,45 @@ class TwinRuntime:
         self.TwinGetStatusString.restype = c_char_p
 
         self._TwinGetModelName = self._twin_runtime_library.TwinGetModelName
+        self._TwinGetModelName.argtypes = [c_void_p]
         self._TwinGetModelName.restype = c_char_p
 
         self._TwinGetNumParameters = (
             self._twin_runtime_library.TwinGetNumParameters
         )
+        self._TwinGetNumParameters.argtypes = [c_void_p, POINTER(c_int)]
         self._TwinGetNumParameters.restype = c_int
 
         self._TwinGetNumInputs = self._twin_runtime_library.TwinGetNumInputs
+        self._TwinGetNumInputs.argtypes = [c_void_p, POINTER(c_int)]
         self._TwinGetNumInputs.restype = c_int
 
         self._TwinGetNumOutputs = self._twin_runtime_library.TwinGetNumOutputs
+        self._TwinGetNumOutputs.argtypes = [c_void_p, POINTER(c_int)]
         self._TwinGetNumOutputs.restype = c_int
 
         self._TwinGetParamNames = self._twin_runtime_library.TwinGetParamNames
+        self._TwinGetParamNames.argtypes = [c_void_p, POINTER(c_char_p), c_int]
         self._TwinGetParamNames.restype = c_int
 
         self._TwinGetInputNames = self._twin_runtime_library.TwinGetInputNames
+        self._TwinGetInputNames.argtypes = [c_void_p, POINTER(c_char_p), c_int]
         self._TwinGetInputNames.restype = c_int
 
         self._TwinGetOutputNames = (
             self._twin_runtime_library.TwinGetOutputNames
         )
+        self._TwinGetOutputNames.argtypes = [
+            c_void_p,
+            POINTER(c_char_p),
+            c_int,
+        ]
         self._TwinGetOutputNames.restype = c_int
 
         self._TwinGetNumberOfDeployments = (
             self._twin_runtime_library.TwinGetNumberOfDeploymentsFromInstance
         )
+        self._TwinGetNumberOfDeployments.argtypes = [c_void_p, POINTER(c_int)]
         self._TwinGetNumberOfDeployments.restype = c_int
 
         self._TwinInstantiate = self._twin_runtime_library.TwinInstantiate
@@ -560,22 +699,41 @@ class TwinRuntime:
         self._TwinSetParamByIndex.restype = c_int
 
         self._TwinGetOutputs = self._twin_runtime_library.TwinGetOutputs
+        self._TwinGetOutputs.argtypes = [c_void_p, POINTER(c_double), c_int]
         self._TwinGetOutputs.restype = c_int
 
         self._TwinSimulate = self._twin_runtime_library.TwinSimulate
+        self._TwinSimulate.argtypes = [c_void_p, c_double, c_double]
         self._TwinSimulate.restype = c_int
 
         self._TwinSimulateBatchMode = (
             self._twin_runtime_library.TwinSimulateBatchMode
         )
+        self._TwinSimulateBatchMode.argtypes = [
+            c_void_p,
+            POINTER(POINTER(c_double)),
+            c_int,
+            POINTER(POINTER(c_double)),
+            c_int,
+            c_double,
+            c_int,
+        ]
         self._TwinSimulateBatchMode.restype = c_int
 
         self._TwinSimulateBatchModeCSV = (
             self._twin_runtime_library.TwinSimulateBatchModeCSV
         )
+        self._TwinSimulateBatchModeCSV.argtypes = [
+            c_void_p,
+            c_char_p,
+            c_char_p,
+            c_double,
+            c_int,
+        ]
         self._TwinSimulateBatchModeCSV.restype = c_int
 
         self._TwinSetInputs = self._twin_runtime_library.TwinSetInputs
+        self._TwinSetInputs.argtypes = [c_void_p, POINTER(c_double), c_int]
         self._TwinSetInputs.restype = c_int
 
         self._TwinSetInputByName = (
@@ -593,106 +751,219 @@ class TwinRuntime:
         self._TwinGetOutputByName = (
             self._twin_runtime_library.TwinGetOutputByName
         )
+        self._TwinGetOutputByName.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_double),
+        ]
         self._TwinGetOutputByName.restype = c_int
 
         self._TwinGetOutputByIndex = (
             self._twin_runtime_library.TwinGetOutputByIndex
         )
+        self._TwinGetOutputByIndex.argtypes = [
+            c_void_p,
+            c_int,
+            POINTER(c_double),
+        ]
         self._TwinGetOutputByIndex.restype = c_int
 
         self._TwinGetDefaultSimulationSettings = (
             self._twin_runtime_library.TwinGetDefaultSimulationSettings
         )
+        self._TwinGetDefaultSimulationSettings.argtypes = [
+            c_void_p,
+            POINTER(c_double),
+            POINTER(c_double),
+            POINTER(c_double),
+        ]
         self._TwinGetDefaultSimulationSettings.restype = c_int
 
         self._TwinGetVarDataType = (
             self._twin_runtime_library.TwinGetVarDataType
         )
+        self._TwinGetVarDataType.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+        ]
         self._TwinGetVarDataType.restype = c_int
 
         self._TwinGetVarUnit = self._twin_runtime_library.TwinGetVarUnit
+        self._TwinGetVarUnit.argtypes = [c_void_p, c_char_p, POINTER(c_char_p)]
         self._TwinGetVarUnit.restype = c_int
 
         self._TwinGetVarStart = self._twin_runtime_library.TwinGetVarStart
+        self._TwinGetVarStart.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_double),
+        ]
         self._TwinGetVarStart.restype = c_int
 
         self._TwinGetStrVarStart = (
             self._twin_runtime_library.TwinGetStrVarStart
         )
+        self._TwinGetStrVarStart.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+        ]
         self._TwinGetStrVarStart.restype = c_int
 
         self._TwinGetVarMin = self._twin_runtime_library.TwinGetVarMin
+        self._TwinGetVarMin.argtypes = [c_void_p, c_char_p, POINTER(c_double)]
         self._TwinGetVarMin.restype = c_int
 
         self._TwinGetVarMax = self._twin_runtime_library.TwinGetVarMax
+        self._TwinGetVarMax.argtypes = [c_void_p, c_char_p, POINTER(c_double)]
         self._TwinGetVarMax.restype = c_int
 
         self._TwinGetVarNominal = self._twin_runtime_library.TwinGetVarNominal
+        self._TwinGetVarNominal.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_double),
+        ]
         self._TwinGetVarNominal.restype = c_int
 
         self._TwinGetVarQuantityType = (
             self._twin_runtime_library.TwinGetVarQuantityType
         )
+        self._TwinGetVarQuantityType.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+        ]
         self._TwinGetVarQuantityType.restype = c_int
 
         self._TwinGetVarDescription = (
             self._twin_runtime_library.TwinGetVarDescription
         )
+        self._TwinGetVarDescription.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+        ]
         self._TwinGetVarDescription.restype = c_int
 
         self._TwinGetVisualizationResources = (
             self._twin_runtime_library.TwinGetVisualizationResources
         )
+        self._TwinGetVisualizationResources.argtypes = [
+            c_void_p,
+            POINTER(c_char_p),
+        ]
         self._TwinGetVisualizationResources.restype = c_int
 
         self._TwinEnableROMImages = (
             self._twin_runtime_library.TwinEnableROMImages
         )
+        self._TwinEnableROMImages.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_int,
+        ]
         self._TwinEnableROMImages.restype = c_int
 
         self._TwinDisableROMImages = (
             self._twin_runtime_library.TwinDisableROMImages
         )
+        self._TwinDisableROMImages.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_int,
+        ]
         self._TwinDisableROMImages.restype = c_int
 
         self._TwinEnable3DROMData = (
             self._twin_runtime_library.TwinEnable3DROMData
         )
+        self._TwinEnable3DROMData.argtypes = [c_void_p, c_char_p]
         self._TwinEnable3DROMData.restype = c_int
 
         self._TwinDisable3DROMData = (
             self._twin_runtime_library.TwinDisable3DROMData
         )
+        self._TwinDisable3DROMData.argtypes = [c_void_p, c_char_p]
         self._TwinDisable3DROMData.restype = c_int
 
         self._TwinGetRomImageFiles = (
             self._twin_runtime_library.TwinGetRomImageFiles
         )
+        self._TwinGetRomImageFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_int,
+            POINTER(c_char_p),
+            c_double,
+            c_double,
+        ]
         self._TwinGetRomImageFiles.restype = c_int
 
         self._TwinGetNumRomImageFiles = (
             self._twin_runtime_library.TwinGetNumRomImageFiles
         )
+        self._TwinGetNumRomImageFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_int,
+            POINTER(c_size_t),
+            c_double,
+            c_double,
+        ]
         self._TwinGetNumRomImageFiles.restype = c_int
 
         self._TwinGetRomModeCoefFiles = (
             self._twin_runtime_library.TwinGetRomModeCoefFiles
         )
+        self._TwinGetRomModeCoefFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_double,
+            c_double,
+        ]
         self._TwinGetRomModeCoefFiles.restype = c_int
 
         self._TwinGetNumRomModeCoefFiles = (
             self._twin_runtime_library.TwinGetNumRomModeCoefFiles
         )
+        self._TwinGetNumRomModeCoefFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_size_t),
+            c_double,
+            c_double,
+        ]
         self._TwinGetNumRomModeCoefFiles.restype = c_int
 
         self._TwinGetRomSnapshotFiles = (
             self._twin_runtime_library.TwinGetRomSnapshotFiles
         )
+        self._TwinGetRomSnapshotFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_double,
+            c_double,
+        ]
         self._TwinGetRomSnapshotFiles.restype = c_int
 
         self._TwinGetNumRomSnapshotFiles = (
             self._twin_runtime_library.TwinGetNumRomSnapshotFiles
         )
+        self._TwinGetNumRomSnapshotFiles.argtypes = [
+            c_void_p,
+            c_char_p,
+            POINTER(c_size_t),
+            c_double,
+            c_double,
+        ]
         self._TwinGetNumRomSnapshotFiles.restype = c_int
 
         self._TwinGetDefaultROMImageDirectory = (
@@ -726,26 +997,13 @@ class TwinRuntime:
         self._TwinSetROMImageDirectory.restype = c_int
 
         self._TwinSaveState = self._twin_runtime_library.TwinSaveState
-        self._TwinSaveState.argtypes = [c_void_p]
+        self._TwinSaveState.argtypes = [c_void_p, c_char_p]
         self._TwinSaveState.restype = c_int
 
         self._TwinLoadState = self._twin_runtime_library.TwinLoadState
-        self._TwinLoadState.argtypes = [c_void_p]
+        self._TwinLoadState.argtypes = [c_void_p, c_char_p, c_bool]
         self._TwinLoadState.restype = c_int
 
-        self.model_path = Path(model_path).resolve()
-        if self.model_path.is_file() is False:
-            raise FileNotFoundError(
-                "File is not found at {}".format(model_path.absolute())
-            )
-
-        if log_path is None:
-            # Getting parent directory
-            file_name = os.path.splitext(model_path)[0]
-            log_path = file_name + ".log"
-
-        self.log_path = Path(log_path).resolve()
-
         if load_model:
             self.twin_load(log_level)
 
@@ -771,15 +1029,12 @@ class TwinRuntime:
         # behavior, which is altered when the SDK launches in Twin Deployer.
         # If this is not reset, some FMUs won't load because their dependent
         # DLLs (from the binaries/win64)  are not found.
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             win32api.SetDllDirectory(None)
-        file_buf = create_string_buffer(str(self.model_path).encode())
-        log_buf = create_string_buffer(str(self.log_path).encode())
-
         self._twin_status = self._TwinOpen(
-            file_buf,
+            self._model_path_c,
             byref(self._modelPointer),
-            log_buf,
+            self._log_path_c,
             c_int(log_level.value),
         )
 
@@ -792,6 +1047,11 @@ class TwinRuntime:
         self.twin_get_number_outputs()
         self.twin_get_number_params()
 
+        self._inputs_c = (c_double * self._number_inputs)()
+        self._inputs_np = np.frombuffer(self._inputs_c, dtype=np.float64)
+        self._outputs_c = (c_double * self._number_outputs)()
+        self._outputs_np = np.frombuffer(self._outputs_c, dtype=np.float64)
+
         self.twin_get_param_names()
         self.twin_get_input_names()
         self.twin_get_output_names()
@@ -841,13 +1101,12 @@ class TwinRuntime:
                 "the number of deployments!"
             )
         c_number_deployments = c_int(0)
-        self.twin_status = self._TwinGetNumberOfDeployments(
+        self._twin_status = self._TwinGetNumberOfDeployments(
             self._modelPointer, byref(c_number_deployments)
         )
         self.evaluate_twin_status(
-            self.twin_status, self, "twin_get_number_of_deployments"
+            self._twin_status, self, "twin_get_number_of_deployments"
         )
-        self.number_outputs = c_number_deployments.value
         return c_number_deployments.value
 
     def twin_get_model_name(self):
@@ -875,24 +1134,25 @@ class TwinRuntime:
         int
             Number of parameters of the TWIN model
         """
+        # Cached once the model is opened and reset when it is closed
+        if self._number_parameters is not None:
+            return self._number_parameters
+
         if self._is_model_opened is False:
             raise TwinRuntimeError(
                 "Model must be opened before returning "
                 "the number of parameters!"
             )
 
-        if self._number_parameters is None:
-            c_number_params = c_int(0)
-            self._twin_status = self._TwinGetNumParameters(
-                self._modelPointer, byref(c_number_params)
-            )
-            self.evaluate_twin_status(
-                self._twin_status, self, "twin_get_number_params"
-            )
-            self._number_parameters = c_number_params.value
-            return self._number_parameters
-        else:
-            return self._number_parameters
+        c_number_params = c_int(0)
+        self._twin_status = self._TwinGetNumParameters(
+            self._modelPointer, byref(c_number_params)
+        )
+        self.evaluate_twin_status(
+            self._twin_status, self, "twin_get_number_params"
+        )
+        self._number_parameters = c_number_params.value
+        return self._number_parameters
 
     def twin_get_number_inputs(self):
         """
@@ -903,24 +1163,25 @@ class TwinRuntime:
         int
             Number of inputs of the TWIN model
         """
+        # Cached once the model is opened and reset when it is closed
+        if self._number_inputs is not None:
+            return self._number_inputs
+
         if self._is_model_opened is False:
             raise TwinRuntimeError(
                 "Model must be opened before returning "
                 "the number of inputs!"
             )
 
-        if self._number_inputs is None:
-            c_number_inputs = c_int(0)
-            self._twin_status = self._TwinGetNumInputs(
-                self._modelPointer, byref(c_number_inputs)
-            )
-            self.evaluate_twin_status(
-                self._twin_status, self, "twin_get_number_inputs"
-            )
-            self._number_inputs = c_number_inputs.value
-            return self._number_inputs
-        else:
-            return self._number_inputs
+        c_number_inputs = c_int(0)
+        self._twin_status = self._TwinGetNumInputs(
+            self._modelPointer, byref(c_number_inputs)
+        )
+        self.evaluate_twin_status(
+            self._twin_status, self, "twin_get_number_inputs"
+        )
+        self._number_inputs = c_number_inputs.value
+        return self._number_inputs
 
     def twin_get_number_outputs(self):
         """
@@ -931,24 +1192,25 @@ class TwinRuntime:
         int
             Number of outputs of the TWIN model
         """
+        # Cached once the model is opened and reset when it is closed
+        if self._number_outputs is not None:
+            return self._number_outputs
+
         if self._is_model_opened is False:
             raise TwinRuntimeError(
                 "Model must be opened before returning "
                 "the number of outputs!"
             )
 
-        if self._number_outputs is None:
-            c_number_outputs = c_int(0)
-            self._twin_status = self._TwinGetNumOutputs(
-                self._modelPointer, byref(c_number_outputs)
-            )
-            self.evaluate_twin_status(
-                self._twin_status, self, "twin_get_number_outputs"
-            )
-            self._number_outputs = c_number_outputs.value
-            return self._number_outputs
-        else:
-            return self._number_outputs
+        c_number_outputs = c_int(0)
+        self._twin_status = self._TwinGetNumOutputs(
+            self._modelPointer, byref(c_number_outputs)
+        )
+        self.evaluate_twin_status(
+            self._twin_status, self, "twin_get_number_outputs"
+        )
+        self._number_outputs = c_number_outputs.value
+        return self._number_outputs
 
     def twin_get_param_names(self):
         """
@@ -965,11 +1227,6 @@ class TwinRuntime:
             )
 
         if self._parameter_names is None:
-            self._TwinGetParamNames.argtypes = [
-                c_void_p,
-                POINTER(c_char_p * self._number_parameters),
-                c_int,
-            ]
 
             parameter_names_c = (c_char_p * self._number_parameters)()
 
@@ -1001,11 +1258,6 @@ class TwinRuntime:
             )
 
         if self._input_names is None:
-            self._TwinGetInputNames.argtypes = [
-                c_void_p,
-                POINTER(c_char_p * self._number_inputs),
-                c_int,
-            ]
 
             input_names_c = (c_char_p * self._number_inputs)()
 
@@ -1037,11 +1289,6 @@ class TwinRuntime:
             )
 
         if self._output_names is None:
-            self._TwinGetInputNames.argtypes = [
-                c_void_p,
-                POINTER(c_char_p * self._number_outputs),
-                c_int,
-            ]
 
             output_names_c = (c_char_p * self._number_outputs)()
 
@@ -1115,13 +1362,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable data type!"
             )
 
-        var_type = c_char_p()
-
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        var_type = self._c_char_p_out
+        var_type.value = None
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarDataType(
-            self._modelPointer, c_char_p(var_name), byref(var_type)
+            self._modelPointer, var_name, byref(var_type)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_type", var_name
@@ -1152,13 +1398,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable quantity type!"
             )
 
-        quantity_type = c_char_p()
-
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        quantity_type = self._c_char_p_out
+        quantity_type.value = None
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarQuantityType(
-            self._modelPointer, c_char_p(var_name), byref(quantity_type)
+            self._modelPointer, var_name, byref(quantity_type)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_quantity_type", var_name
@@ -1188,13 +1433,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable description!"
             )
 
-        var_description = c_char_p()
-
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        var_description = self._c_char_p_out
+        var_description.value = None
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarDescription(
-            self._modelPointer, c_char_p(var_name), byref(var_description)
+            self._modelPointer, var_name, byref(var_description)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_description", var_name
@@ -1224,13 +1468,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable unit type!"
             )
 
-        var_unit = c_char_p()
-
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        var_unit = self._c_char_p_out
+        var_unit.value = None
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarUnit(
-            self._modelPointer, c_char_p(var_name), byref(var_unit)
+            self._modelPointer, var_name, byref(var_unit)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_unit", var_name
@@ -1260,12 +1503,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable start value!"
             )
 
-        start_value = c_double()
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        start_value = self._c_double_out
+        start_value.value = 0.0
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarStart(
-            self._modelPointer, c_char_p(var_name), byref(start_value)
+            self._modelPointer, var_name, byref(start_value)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_start", var_name
@@ -1292,12 +1535,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable start value!"
             )
 
-        start_value = c_char_p()
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        start_value = self._c_char_p_out
+        start_value.value = None
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetStrVarStart(
-            self._modelPointer, c_char_p(var_name), byref(start_value)
+            self._modelPointer, var_name, byref(start_value)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_str_var_start", var_name
@@ -1324,12 +1567,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable minimum value!"
             )
 
-        min_value = c_double()
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        min_value = self._c_double_out
+        min_value.value = 0.0
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarMin(
-            self._modelPointer, c_char_p(var_name), byref(min_value)
+            self._modelPointer, var_name, byref(min_value)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_min", var_name
@@ -1356,12 +1599,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable maximum value!"
             )
 
-        max_value = c_double()
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        max_value = self._c_double_out
+        max_value.value = 0.0
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarMax(
-            self._modelPointer, c_char_p(var_name), byref(max_value)
+            self._modelPointer, var_name, byref(max_value)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_max", var_name
@@ -1388,12 +1631,12 @@ class TwinRuntime:
                 "Model must be opened before returning variable nominal value!"
             )
 
-        nominal_value = c_double()
-        if type(var_name) is not bytes:
-            var_name = var_name.encode()
+        nominal_value = self._c_double_out
+        nominal_value.value = 0.0
+        var_name = _encode_name(var_name)
 
         property_status = self._TwinGetVarNominal(
-            self._modelPointer, c_char_p(var_name), byref(nominal_value)
+            self._modelPointer, var_name, byref(nominal_value)
         )
         self.evaluate_twin_prop_status(
             property_status, self, "twin_get_var_nominal", var_name
@@ -1459,10 +1702,12 @@ class TwinRuntime:
                 "Model must be initialized before simulation!"
             )
 
-        self._twin_status = self._TwinSimulate(
-            self._modelPointer, c_double(time_stop), c_double(time_step)
-        )
-        self.evaluate_twin_status(self._twin_status, self, "twin_simulate")
+        # The status is kept in a local and the values are converted by the
+        # declared argtypes, as this method is called at each time step
+        status = self._TwinSimulate(self._modelPointer, time_stop, time_step)
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_simulate")
 
     def twin_simulate_batch_mode(
         self,
@@ -1506,56 +1751,53 @@ class TwinRuntime:
                 "Model must be initialized before simulation!"
             )
 
-        # Creates a local copy so that the source DF does not
-        # get modified outside this scope
+        # The source DF is only read: reset_index returns a new frame
         local_df = input_df
         num_input_rows = local_df.shape[0]
         if time_as_index:
             local_df = local_df.reset_index()
 
-        end_time = local_df.iloc[-1, 0]
+        # Work on a single contiguous float64 buffer: the SDK reads each input
+        # row in place through a pointer into it
+        input_np = np.ascontiguousarray(local_df.to_numpy(dtype=np.float64))
+        times = input_np[:, 0]
+
+        end_time = times[-1]
         if step_size != 0:
             max_output_rows = int(math.ceil(end_time / step_size) + 1)
         else:
-            if local_df.iloc[0, 0] > 0:
+            if times[0] > 0:
                 max_output_rows = (
                     num_input_rows + 1
                 )  # + 1 to account for t=0 that's not on the input DF
             else:
                 max_output_rows = num_input_rows
 
-        # Preallocate Dataframe rows
-        local_df = local_df.astype(np.float64)
-        input_data = build_ctype_2d_array(num_input_rows, local_df)
+        input_data = build_ctype_row_pointers(input_np)
 
-        # Pandas float to Python equivalent
-        out_data = build_empty_ctype_2d_array(
-            max_output_rows, output_number_of_columns
-        )
+        # The SDK writes the results straight into a preallocated output array
+        output_np = np.zeros((max_output_rows, output_number_of_columns))
+        out_data = build_ctype_row_pointers(output_np)
 
         self._twin_status = self._TwinSimulateBatchMode(
             self._modelPointer,
-            byref(input_data),
+            input_data,
             c_int(num_input_rows),
-            byref(out_data),
+            out_data,
             c_int(max_output_rows),
             c_double(step_size),
             c_int(interpolate),
         )
-        data = [
-            np.ctypeslib.as_array(
-                out_data[i], shape=(output_number_of_columns,)
-            )
-            for i in range(max_output_rows)
-        ]
         output_df = pd.DataFrame(
-            data=data,
+            data=output_np,
             index=np.arange(0, max_output_rows),
             columns=output_column_names,
+            copy=False,
         )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_simulate_batch_mode"
-        )
+        if self._twin_status:
+            self.evaluate_twin_status(
+                self._twin_status, self, "twin_simulate_batch_mode"
+            )
 
         return output_df
 
@@ -1593,9 +1835,6 @@ class TwinRuntime:
         if type(output_csv) is not bytes:
             output_csv = output_csv.encode()
 
-        input_csv = create_string_buffer(input_csv)
-        output_csv = create_string_buffer(output_csv)
-
         self._twin_status = self._TwinSimulateBatchModeCSV(
             self._modelPointer,
             input_csv,
@@ -1640,48 +1879,45 @@ class TwinRuntime:
                 "Input array size must match the the models number of inputs!"
             )
 
-        array_np = np.array(input_array, dtype=float)
-        array_ctypes = array_np.ctypes.data_as(
-            POINTER(c_double * self._number_inputs)
-        )
+        self._inputs_np[:] = input_array
 
-        self._TwinSetInputs.argtypes = [
-            c_void_p,
-            POINTER(c_double * self._number_inputs),
-            c_int,
-        ]
-        self._twin_status = self._TwinSetInputs(
-            self._modelPointer, array_ctypes, self._number_inputs
+        status = self._TwinSetInputs(
+            self._modelPointer, self._inputs_c, self._number_inputs
         )
-        self.evaluate_twin_status(self._twin_status, self, "twin_get_outputs")
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_set_inputs")
 
-    def twin_get_outputs(self):
+    def twin_get_outputs(self, as_array=False):
         """
         Retrieves the current value of all the TWIN outputs.
 
+        Parameters
+        ----------
+        as_array : bool (optional)
+            Flag to return the outputs value as a numpy.ndarray instead of
+            a list. Default is False.
+
         Returns
         -------
-        list
-            List of outputs value.
+        list or numpy.ndarray
+            List (or array if as_array is True) of outputs value.
         """
         if self._is_model_initialized is False:
             raise TwinRuntimeError(
                 "Model must be initialized before it can return outputs!"
             )
 
-        self._TwinGetOutputs.argtypes = [
-            c_void_p,
-            POINTER(c_double * self._number_outputs),
-            c_int,
-        ]
-        outputs = (c_double * self._number_outputs)()
-
-        self._twin_status = self._TwinGetOutputs(
-            self._modelPointer, outputs, self._number_outputs
+        status = self._TwinGetOutputs(
+            self._modelPointer, self._outputs_c, self._number_outputs
         )
-        self.evaluate_twin_status(self._twin_status, self, "twin_get_outputs")
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_get_outputs")
 
-        outputs_list = np.array(outputs).tolist()
+        if as_array:
+            return self._outputs_np.copy()
+        outputs_list = self._outputs_np.tolist()
         return outputs_list
 
     def twin_set_param_by_name(self, param_name, value):
@@ -1700,15 +1936,12 @@ class TwinRuntime:
                 "Model must be instantiated before setting parameters!"
             )
 
-        if isinstance(param_name, str):
-            param_name = param_name.encode()
-
-        self._twin_status = self._TwinSetParamByName(
-            self._modelPointer, c_char_p(param_name), c_double(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_set_param_by_name"
+        status = self._TwinSetParamByName(
+            self._modelPointer, _encode_name(param_name), value
         )
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_set_param_by_name")
 
     def twin_set_str_param_by_name(self, param_name, value):
         """
@@ -1756,12 +1989,10 @@ class TwinRuntime:
                 "Model must be instantiated before setting parameters!"
             )
 
-        self._twin_status = self._TwinSetParamByIndex(
-            self._modelPointer, c_int(index), c_double(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_set_param_by_index"
-        )
+        status = self._TwinSetParamByIndex(self._modelPointer, index, value)
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_set_param_by_index")
 
     def twin_set_input_by_name(self, input_name, value):
         """
@@ -1779,15 +2010,12 @@ class TwinRuntime:
                 "Model must be instantiated before setting inputs!"
             )
 
-        if isinstance(input_name, str):
-            input_name = input_name.encode()
-
-        self._twin_status = self._TwinSetInputByName(
-            self._modelPointer, c_char_p(input_name), c_double(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_set_input_by_name"
+        status = self._TwinSetInputByName(
+            self._modelPointer, _encode_name(input_name), value
         )
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_set_input_by_name")
 
     def twin_set_input_by_index(self, index, value):
         """
@@ -1805,12 +2033,10 @@ class TwinRuntime:
                 "Model must be instantiated before setting inputs!"
             )
 
-        self._twin_status = self._TwinSetInputByIndex(
-            self._modelPointer, c_int(index), c_double(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_set_input_by_index"
-        )
+        status = self._TwinSetInputByIndex(self._modelPointer, index, value)
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_set_input_by_index")
 
     def twin_get_output_by_name(self, output_name):
         """
@@ -1827,12 +2053,12 @@ class TwinRuntime:
             )
 
         value = c_double(0)
-        self._twin_status = self._TwinGetOutputByName(
-            self._modelPointer, c_char_p(output_name.encode()), byref(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_get_output_by_name"
+        status = self._TwinGetOutputByName(
+            self._modelPointer, _encode_name(output_name), byref(value)
         )
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_get_output_by_name")
         return value
 
     def twin_get_output_by_index(self, index):
@@ -1850,12 +2076,12 @@ class TwinRuntime:
             )
 
         value = c_double(0)
-        self._twin_status = self._TwinGetOutputByIndex(
-            self._modelPointer, c_int(index), byref(value)
-        )
-        self.evaluate_twin_status(
-            self._twin_status, self, "twin_get_output_by_index"
+        status = self._TwinGetOutputByIndex(
+            self._modelPointer, index, byref(value)
         )
+        self._twin_status = status
+        if status:
+            self.evaluate_twin_status(status, self, "twin_get_output_by_index")
         return value
 
     def twin_get_visualization_resources(self):
@@ -1912,11 +2138,10 @@ class TwinRuntime:
         str
             Absolute path to the resources directory.
         """
-        if type(model_name) is not bytes:
-            model_name = model_name.encode()
+        model_name = _encode_name(model_name)
         default_location = c_char_p()
         self._twin_status = self._TwinGetDefaultROMImageDirectory(
-            self._modelPointer, c_char_p(model_name), byref(default_location)
+            self._modelPointer, model_name, byref(default_location)
         )
         self.evaluate_twin_status(
             self._twin_status, self, "twin_get_default_rom_image_location"
@@ -1937,12 +2162,11 @@ class TwinRuntime:
         directory_path : str
             Aboslute path of the directory where to store the images.
         """
-        if type(model_name) is not bytes:
-            model_name = model_name.encode()
+        model_name = _encode_name(model_name)
         if type(directory_path) is not bytes:
             directory_path = directory_path.encode()
         self._twin_status = self._TwinSetROMImageDirectory(
-            self._modelPointer, c_char_p(model_name), c_char_p(directory_path)
+            self._modelPointer, model_name, c_char_p(directory_path)
         )
         self.evaluate_twin_status(
             self._twin_status, self, "twin_set_rom_image_directory"
@@ -1964,13 +2188,11 @@ class TwinRuntime:
             View names for which the image generation needs to be enabled.
         """
         n_views_c = c_int(len(views))
-        array_ctypes = (c_char_p * len(views))()
-        for ind, view_name in enumerate(views):
-            array_ctypes[ind] = view_name.encode()
+        array_ctypes = to_c_char_p_array(views)
 
         self._twin_status = self._TwinEnableROMImages(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             array_ctypes,
             n_views_c,
         )
@@ -1994,13 +2216,11 @@ class TwinRuntime:
             View names for which the image generation needs to be disabled.
         """
         n_views_c = c_int(len(views))
-        array_ctypes = (c_char_p * len(views))()
-        for ind, view_name in enumerate(views):
-            array_ctypes[ind] = view_name.encode()
+        array_ctypes = to_c_char_p_array(views)
 
         self._twin_status = self._TwinDisableROMImages(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             array_ctypes,
             n_views_c,
         )
@@ -2025,11 +2245,10 @@ class TwinRuntime:
         str
             Absolute path to the resources' directory of the TBROM model.
         """
-        if type(model_name) is not bytes:
-            model_name = model_name.encode()
+        model_name = _encode_name(model_name)
         ret = c_char_p()
         self._twin_status = self._TwinGetRomResourcePath(
-            self._modelPointer, c_char_p(model_name), byref(ret)
+            self._modelPointer, model_name, byref(ret)
         )
         self.evaluate_twin_status(
             self._twin_status, self, "twin_get_rom_resource_directory"
@@ -2052,7 +2271,7 @@ class TwinRuntime:
             to be enabled.
         """
         self._twin_status = self._TwinEnable3DROMData(
-            self._modelPointer, c_char_p(model_name.encode())
+            self._modelPointer, _encode_name(model_name)
         )
         self.evaluate_twin_status(
             self._twin_status, self, "twin_enable_3d_rom_model_data"
@@ -2073,7 +2292,7 @@ class TwinRuntime:
             to be disabled.
         """
         self._twin_status = self._TwinDisable3DROMData(
-            self._modelPointer, c_char_p(model_name.encode())
+            self._modelPointer, _encode_name(model_name)
         )
         self.evaluate_twin_status(
             self._twin_status, self, "twin_disable_3d_rom_model_data"
@@ -2107,14 +2326,12 @@ class TwinRuntime:
             List of path of all the images retrieved
         """
         n_views_c = c_int(len(views))
-        array_ctypes = (c_char_p * len(views))()
-        for ind, view_name in enumerate(views):
-            array_ctypes[ind] = view_name.encode()
+        array_ctypes = to_c_char_p_array(views)
 
         num_files_c = c_size_t()
         self._twin_status = self._TwinGetNumRomImageFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             array_ctypes,
             n_views_c,
             byref(num_files_c),
@@ -2128,10 +2345,10 @@ class TwinRuntime:
         image_files_c = (c_char_p * num_files_c.value)()
         self._twin_status = self._TwinGetRomImageFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             array_ctypes,
             n_views_c,
-            byref(image_files_c),
+            image_files_c,
             c_double(time_from),
             c_double(time_to),
         )
@@ -2171,7 +2388,7 @@ class TwinRuntime:
         num_files_c = c_size_t()
         self._twin_status = self._TwinGetNumRomModeCoefFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             byref(num_files_c),
             c_double(time_from),
             c_double(time_to),
@@ -2183,8 +2400,8 @@ class TwinRuntime:
         bin_files_c = (c_char_p * num_files_c.value)()
         self._twin_status = self._TwinGetRomModeCoefFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
-            byref(bin_files_c),
+            _encode_name(model_name),
+            bin_files_c,
             c_double(time_from),
             c_double(time_to),
         )
@@ -2222,7 +2439,7 @@ class TwinRuntime:
         num_files_c = c_size_t()
         self._twin_status = self._TwinGetNumRomSnapshotFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
+            _encode_name(model_name),
             byref(num_files_c),
             c_double(time_from),
             c_double(time_to),
@@ -2234,8 +2451,8 @@ class TwinRuntime:
         bin_files_c = (c_char_p * num_files_c.value)()
         self._twin_status = self._TwinGetRomSnapshotFiles(
             self._modelPointer,
-            c_char_p(model_name.encode()),
-            byref(bin_files_c),
+            _encode_name(model_name),
+            bin_files_c,
             c_double(time_from),
             c_double(time_to),
         )
@@ -2489,66 +2706,59 @@ class TwinRuntime:
         list
             List of the variables properties evaluated.
         """
+        if self._is_model_opened is False:
+            raise TwinRuntimeError(
+                "Model must be opened before returning variable properties!"
+            )
+
+        # The SDK getters are called directly: a property that is not
+        # available is reported by its status flag, which avoids raising
+        # (and building the message of) an exception for each of them
+        str_getters = (
+            self._TwinGetVarUnit,
+            self._TwinGetVarQuantityType,
+            self._TwinGetVarDescription,
+        )
+        double_getters = (
+            self._TwinGetVarStart,
+            self._TwinGetVarMin,
+            self._TwinGetVarMax,
+        )
+        str_value = self._c_char_p_out
+        double_value = self._c_double_out
+
         prop_matrix_list = []
         for value in var_names:
-            o_name = value
-            try:
-                o_unit = self.twin_get_var_unit(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ) as e:
-                o_unit = e.property_status_flag.name
-            try:
-                o_quantity_type = self.twin_get_var_quantity_type(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ) as e:
-                o_quantity_type = e.property_status_flag.name
-            try:
-                o_var_description = self.twin_get_var_description(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ) as e:
-                o_var_description = e.property_status_flag.name
-            try:
-                o_start = self.twin_get_var_start(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ):
-                o_start = None
-            try:
-                o_min = self.twin_get_var_min(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ):
-                o_min = None
-            try:
-                o_max = self.twin_get_var_max(value)
-            except (
-                PropertyNotDefinedError,
-                PropertyNotApplicableError,
-                PropertyInvalidError,
-                PropertyError,
-            ):
-                o_max = None
+            var_name = _encode_name(value)
+
+            str_props = []
+            for getter in str_getters:
+                str_value.value = None
+                prop_status = getter(
+                    self._modelPointer, var_name, byref(str_value)
+                )
+                if prop_status in _PROPERTY_ERROR_STATUSES:
+                    str_props.append(PropertyStatusFlag(prop_status).name)
+                elif str_value.value is None:
+                    str_props.append(None)
+                else:
+                    str_props.append(str_value.value.decode())
 
+            double_props = []
+            for getter in double_getters:
+                double_value.value = 0.0
+                prop_status = getter(
+                    self._modelPointer, var_name, byref(double_value)
+                )
+                if prop_status in _PROPERTY_ERROR_STATUSES:
+                    double_props.append(None)
+                else:
+                    double_props.append(double_value.value)
+
+            o_unit, o_quantity_type, o_var_description = str_props
+            o_start, o_min, o_max = double_props
             prop_row = [
-                o_name,
+                value,
                 o_unit,
                 o_quantity_type,
                 o_start,
@@ -2561,33 +2771,97 @@ class TwinRuntime:
 
 
 def build_empty_ctype_2d_array(num_input_rows, number_of_columns):
-    row_elements = c_double * number_of_columns
+    # Rows point into a single zero-initialized contiguous array
+    return build_ctype_row_pointers(
+        np.zeros((num_input_rows, number_of_columns))
+    )
 
-    # The one liner below initializes each row if 'input_data' with an array
-    # of 'number_of_column' elements 'row_elements()' creates one ctypes
-    # array for each input row
-    input_data = (POINTER(c_double) * num_input_rows)(
-        *[row_elements() for _ in range(num_input_rows)]
+
+def build_ctype_2d_array(num_input_rows, source_df):
+    # Rows point into one contiguous float64 copy of the dataframe values
+    return build_ctype_row_pointers(
+        np.ascontiguousarray(
+            source_df.to_numpy(dtype=np.float64)[:num_input_rows]
+        )
     )
 
-    return input_data
+
+def build_ctype_row_pointers(array_np):
+    # Returns a ctypes array of pointers to each row of the given C-contiguous
+    # 2D float64 array. No data is copied: the array is referenced by the
+    # returned object so that it outlives the pointers.
+    row_addresses = array_np.ctypes.data + array_np.strides[0] * np.arange(
+        array_np.shape[0], dtype=np.uintp
+    )
+    row_pointers = (POINTER(c_double) * array_np.shape[0]).from_buffer(
+        row_addresses
+    )
+    row_pointers._array = array_np
+    return row_pointers
+
+
+def _file_cache_key(file_path):
+    # Absolute path and modification time of the given file, used as cache
+    # key so that a TWIN file rewritten in place is read again
+    file_path = os.path.abspath(file_path)
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return file_path, mtime_ns
+
+
+@functools.lru_cache(maxsize=128)
+def _read_twin_binaries(file_path, mtime_ns):
+    with zipfile.ZipFile(file_path) as zip_handler:
+        zip_contents = zip_handler.namelist()
+    return (
+        "binaries/win64/" in zip_contents,
+        "binaries/linux64/" in zip_contents,
+    )
 
 
-def build_ctype_2d_array(num_input_rows, source_df):
-    input_data = (POINTER(c_double) * num_input_rows)()
-    number_of_columns = source_df.shape[1]
+@functools.lru_cache(maxsize=128)
+def _read_twin_version(file_path, mtime_ns):
+    TwinGetVersion = TwinRuntime.load_dll().TwinGetVersion
+
+    if type(file_path) is not bytes:
+        file_path = file_path.encode()
+
+    valid_model = c_bool()
+    twin_version = c_char_p()
+    TwinGetVersion(
+        c_char_p(file_path), byref(valid_model), byref(twin_version)
+    )
+    return valid_model.value, twin_version.value.decode()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_twin_model_dependencies(file_path, mtime_ns):
+    # The raw JSON string is cached so that each caller decodes its own
+    # dictionary and cannot alter the cached result
+    TwinGetModelDependencies = (
+        TwinRuntime.load_dll().TwinGetModelDependencies
+    )
+
+    if type(file_path) is not bytes:
+        file_path = file_path.encode()
+
+    twin_dependencies = c_char_p()
+    TwinGetModelDependencies(c_char_p(file_path), byref(twin_dependencies))
+    return twin_dependencies.value
 
-    row_size = c_double * number_of_columns
-    for i in range(num_input_rows):
-        # Allocate arrays of double
-        input_data[i] = row_size()
-        for j in range(number_of_columns):
-            input_data[i][j] = source_df.iat[i, j]
 
-    return input_data
+def to_c_char_p_array(names):
+    # Encoded names are passed to the ctypes array constructor at once
+    # rather than assigned one element at a time
+    encoded_names = [_encode_name(name) for name in names]
+    return (c_char_p * len(encoded_names))(*encoded_names)
 
 
 def to_np_array(ctypes_array):
-    array_np = np.array([x.decode() for x in ctypes_array])
+    # Slicing the ctypes array returns all the C strings as a list of bytes in
+    # one call, which are then decoded without a Python-level loop
+    array_np = np.array(list(map(bytes.decode, ctypes_array[:])))
 
     return array_np
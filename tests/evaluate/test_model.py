@@ -70,3 +70,19 @@ class TestModel:
         model2._log_message("Hello B from model 2!")
         with open(get_pytwin_log_file(), "r") as f:
             assert len(f.readlines()) == 4
+
+    def test_log_prefix_follows_log_key(self):
+        # Init test context
+        reinit_settings()
+        # Run test
+        model = Model()
+        model._model_name = "model"
+        model._id = "1"
+        model._log_key = "KeyA"
+        model._log_message("Hello from key A!")
+        model._log_key = "KeyB"
+        model._log_message("Hello from key B!")
+        with open(get_pytwin_log_file(), "r") as f:
+            log_lines = f.readlines()
+        assert "[model.1][KeyA] Hello from key A!" in log_lines[-2]
+        assert "[model.1][KeyB] Hello from key B!" in log_lines[-1]
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
 import os
 
 from pytwin import get_pytwin_log_file
@@ -174,9 +175,122 @@ class TestSavedStateRegistry:
             log_lines = fp.readlines()
         assert "Multiple saved states were found. The first one is " in "".join(log_lines)
 
+    def test_extract_saved_state_from_legacy_registry(self):
+        # Initialize unit test with a new model directory
+        test_model = Model()
+        test_model._model_name = UNIT_TEST_MODEL_NAME
+        os.mkdir(test_model.model_dir)
+        ss_dict = {
+            SavedState.ID_KEY: "1234abcd",
+            SavedState.TIME_KEY: 0.12345678,
+            SavedState.INPUTS_KEY: {"input1": 1.0, "input2": 2.0},
+            SavedState.OUTPUTS_KEY: {"output1": 11.0, "output2": 22.0},
+            SavedState.PARAMETERS_KEY: {"param1": 0.1, "param2": 0.2},
+        }
+
+        # Test registry file written by previous versions can still be read
+        ssr = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        with open(ssr.legacy_registry_filepath, "w", encoding="utf-8") as fp:
+            json.dump({SavedStateRegistry.SAVED_STATES_KEY: [ss_dict]}, fp, indent=4)
+        extracted_ss = ssr.extract_saved_state(simulation_time=0.12345678, epsilon=1e-8)
+        assert compare_dictionary(extracted_ss.dump(), ss_dict)
+
+        # Test saved states of previous versions can still be found after appending a new saved state
+        ss = SavedState()
+        ss.time = 1.0
+        ssr.append_saved_state(ss)
+        ssr = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        extracted_ss = ssr.extract_saved_state(simulation_time=0.12345678, epsilon=1e-8)
+        assert compare_dictionary(extracted_ss.dump(), ss_dict)
+        extracted_ss = ssr.extract_saved_state(simulation_time=1.0, epsilon=1e-8)
+        assert extracted_ss._id == ss._id
+
+    def test_extract_saved_state_reuses_loaded_registry(self):
+        # Initialize unit test with a new model directory
+        test_model = Model()
+        test_model._model_name = UNIT_TEST_MODEL_NAME
+        os.mkdir(test_model.model_dir)
+        writer = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        for time in [0.0, 1.0]:
+            ss = SavedState()
+            ss.time = time
+            writer.append_saved_state(ss)
+
+        # Test registry file is not read again and saved state times are not converted again between extractions
+        reader = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        assert reader.extract_saved_state(simulation_time=0.0, epsilon=1e-8).time == 0.0
+        saved_states = reader._saved_states
+        times_array = reader._times_array
+        assert reader.extract_saved_state(simulation_time=1.0, epsilon=1e-8).time == 1.0
+        assert reader._saved_states is saved_states
+        assert reader._times_array is times_array
+
+        # Test saved states appended by the registry itself are found without reading the registry file again
+        ss = SavedState()
+        ss.time = 2.0
+        reader.append_saved_state(ss)
+        assert reader.extract_saved_state(simulation_time=2.0, epsilon=1e-8)._id == ss._id
+        assert reader._saved_states is saved_states
+
+        # Test saved states appended by another registry are found
+        ss = SavedState()
+        ss.time = 3.0
+        writer.append_saved_state(ss)
+        assert reader.extract_saved_state(simulation_time=3.0, epsilon=1e-8)._id == ss._id
+        assert reader._saved_states is not saved_states
+        assert len(reader._saved_states) == 4
+
+    def test_extract_saved_state_not_chronologically_appended(self):
+        # Initialize unit test with a new model directory
+        test_model = Model()
+        test_model._model_name = UNIT_TEST_MODEL_NAME
+        os.mkdir(test_model.model_dir)
+        ssr = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        for time in [0.0, 2.0, 1.0, 3.0]:
+            ss = SavedState()
+            ss.time = time
+            ssr.append_saved_state(ss)
+
+        # Test extraction from the registry that appended the saved states and from a new registry
+        for registry in [ssr, SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)]:
+            for time in [0.0, 1.0, 2.0, 3.0]:
+                assert registry.extract_saved_state(simulation_time=time, epsilon=1e-8).time == time
+            assert registry.extract_saved_state(simulation_time=1.4, epsilon=0.5).time == 1.0
+            try:
+                registry.extract_saved_state(simulation_time=1.5, epsilon=0.1)
+            except SavedStateRegistryError as e:
+                assert "No state at simulation time 1.5 was found." in str(e)
+
+    def test_extract_saved_state_with_nan_values(self):
+        # Initialize unit test with a new model directory
+        test_model = Model()
+        test_model._model_name = UNIT_TEST_MODEL_NAME
+        os.mkdir(test_model.model_dir)
+        ss = SavedState()
+        ss.time = 0.5
+        ss.outputs = {"output1": float("nan")}
+        ssr = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        ssr.append_saved_state(ss)
+
+        # Test NaN values written in the registry file can be read back
+        extracted_ss = ssr.extract_saved_state(simulation_time=0.5, epsilon=1e-8)
+        assert extracted_ss.outputs["output1"] != extracted_ss.outputs["output1"]
+
     def test_raise_error(self):
         # Raise error if model dir does not exist
         try:
             SavedStateRegistry(model_id="unknown", model_name="unknown")
         except SavedStateRegistryError as e:
             assert "Use an existing model ID or model name." in str(e)
+
+        # Raise error if registry file misses the saved states key
+        test_model = Model()
+        test_model._model_name = UNIT_TEST_MODEL_NAME
+        os.mkdir(test_model.model_dir)
+        ssr = SavedStateRegistry(model_id=test_model.id, model_name=test_model.name)
+        with open(ssr.legacy_registry_filepath, "w", encoding="utf-8") as fp:
+            json.dump({"states": []}, fp)
+        try:
+            ssr.extract_saved_state(simulation_time=0.0, epsilon=1e-8)
+        except SavedStateRegistryError as e:
+            assert f"No '{SavedStateRegistry.SAVED_STATES_KEY}' key was found." in str(e)
@@ -266,6 +266,27 @@ class TestTbRom:
         assert tbrom2._hasinfmcs["inputPressure"] is True
         assert tbrom2._hasinfmcs["inputTemperature"] is False
 
+    def test_evaluation_inputs_are_set_by_name_tbrom7(self):
+        """
+        TEST_TB_ROM7
+        Inputs given to the twin model evaluation are set by name, whatever the order of the twin runtime inputs.
+        """
+        model_filepath = TEST_TB_ROM7
+        twinmodel = TwinModel(model_filepath=model_filepath)
+        twinmodel.initialize_evaluation()
+        inputs = {name: 1.0 + 0.5 * i for i, name in enumerate(twinmodel.inputs)}
+        twinmodel.evaluate_step_by_step(step_size=0.1, inputs=inputs)
+
+        # Reference results with inputs set one by one by name on the twin runtime
+        reference = TwinModel(model_filepath=model_filepath)
+        reference.initialize_evaluation()
+        for name, value in inputs.items():
+            reference._twin_runtime.twin_set_input_by_name(input_name=name, value=value)
+        reference._twin_runtime.twin_simulate(0.1)
+        reference_outputs = list(reference._twin_runtime.twin_get_outputs())
+
+        assert np.allclose(list(twinmodel.outputs.values()), reference_outputs)
+
     def test_instantiate_evaluation_tbrom8(self):
         """
         TEST_TB_ROM8
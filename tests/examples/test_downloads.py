@@ -21,6 +21,7 @@
 # SOFTWARE.
 
 import os
+import pathlib
 import shutil
 
 import pytwin.examples.downloads as dld
@@ -43,6 +44,26 @@ class TestDownloads:
         assert os.path.exists(unit_test_folder)
         assert len(os.listdir(unit_test_folder)) == 2
 
+    def test_retrieve_file_is_atomic(self):
+        dld.delete_downloads()
+        url = pathlib.Path(__file__).as_uri()
+        local_dir = os.path.join(dld.EXAMPLES_PATH, "unit_test_files")
+        local_path = os.path.join(local_dir, "test_downloads.py")
+        # Empty file left over by an interrupted download is downloaded again
+        os.makedirs(local_dir)
+        with open(local_path, "w"):
+            pass
+        assert dld._retrieve_file(url, "test_downloads.py", "unit_test_files") == local_path
+        assert os.path.getsize(local_path) == os.path.getsize(__file__)
+        # No temporary file is left in the download directory
+        assert os.listdir(local_dir) == ["test_downloads.py"]
+        # Failed download does not leave any file in the download directory
+        try:
+            dld._retrieve_file(url + ".missing", "missing.py", "unit_test_files")
+        except Exception:
+            pass
+        assert os.listdir(local_dir) == ["test_downloads.py"]
+
     def test_download_file(self):
         dld.delete_downloads()
         my_file_path = dld.download_file("CoupledClutches_23R1_other.twin", "twin_files", force_download=True)
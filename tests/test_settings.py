@@ -24,6 +24,7 @@ import logging
 import os
 import shutil
 import tempfile
+import time
 
 from pytwin import (
     PyTwinLogLevel,
@@ -109,6 +110,63 @@ class TestDefaultSettings:
         assert not pytwin_logging_is_enabled()
         assert level == LogLevel.TWIN_NO_LOG
 
+    def test_logging_is_enabled_for_level(self):
+        from pytwin.settings import pytwin_logging_is_enabled_for
+
+        # Init unit test
+        reinit_settings()
+        # Default level is INFO
+        assert not pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_DEBUG)
+        assert pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_INFO)
+        assert pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_CRITICAL)
+        # Level gate follows level modification
+        modify_pytwin_logging(new_level=PyTwinLogLevel.PYTWIN_LOG_ERROR)
+        assert not pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_WARNING)
+        assert pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_ERROR)
+        # Nothing is emitted when logging is disabled
+        modify_pytwin_logging(new_option=PyTwinLogOption.PYTWIN_LOGGING_OPT_NOLOGGING)
+        assert not pytwin_logging_is_enabled_for(PyTwinLogLevel.PYTWIN_LOG_CRITICAL)
+
+    def test_modify_logging_buffered(self):
+        from logging.handlers import QueueHandler
+
+        from pytwin.settings import _PyTwinSettings
+
+        # Init unit test
+        reinit_settings()
+        log_file = get_pytwin_log_file()
+        # Buffered logging writes records from a background thread
+        modify_pytwin_logging(buffered=True)
+        logger = get_pytwin_logger()
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], QueueHandler)
+        logger.info("Hello buffered")
+        logger.debug("Hello filtered")
+        # Records kept in the file buffer are written to disk within the flush interval
+        for _ in range(20):
+            with open(log_file, "r") as f:
+                if "Hello buffered" in f.read():
+                    break
+            time.sleep(_PyTwinSettings.LOGGING_FLUSH_INTERVAL / 10)
+        with open(log_file, "r") as f:
+            assert "Hello buffered" in f.read()
+        # Going back to unbuffered logging flushes pending records into the same log file
+        modify_pytwin_logging(buffered=False)
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.FileHandler)
+        logger.info("Hello unbuffered")
+        with open(log_file, "r") as f:
+            lines = f.readlines()
+        assert get_pytwin_log_file() == log_file
+        assert "Hello buffered" in lines[-2]
+        assert "Hello unbuffered" in lines[-1]
+        assert "Hello filtered" not in "".join(lines)
+        # Buffering argument must be a Boolean
+        try:
+            modify_pytwin_logging(buffered="yes")
+        except PyTwinSettingsError as e:
+            assert "'buffered' argument must be Boolean" in str(e)
+
     def test_modify_logging_console(self):
         # Init unit test
         reinit_settings()